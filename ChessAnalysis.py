@@ -0,0 +1,183 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Scores every root move of a position with alpha-beta searches split across processes
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from ChessMailbox import MailboxBoard
+
+# Material values, Kings are priceless and never counted
+PIECE_VALUES = {'P': 100, 'N': 300, 'B': 300, 'R': 500, 'Q': 900, 'K': 0}
+
+# Score of a won game, beyond any material count
+WIN_SCORE = 100000
+
+DEFAULT_DEPTH = 3
+
+
+# SEARCH
+def evaluate(board):
+    """Gets the material balance from the point of view of the player to move"""
+    color = board.get_player_turn()[0]
+    score = 0
+    for _, code, _ in board.get_snapshot()[1]:
+        value = PIECE_VALUES[code[1]]
+        score += value if code[0] == color else -value
+    return score
+
+
+def negamax(board, depth, alpha, beta, counter):
+    """Gets the score of a position for the player to move, counting visited nodes in counter[0]"""
+    counter[0] += 1
+    game_state = board.get_game_state()
+    if game_state == 'DRAW':
+        return 0
+    if game_state != 'UNFINISHED':
+        # Remaining depth rewards quicker wins and slower losses
+        won = game_state[0] == board.get_player_turn()[0]
+        return WIN_SCORE + depth if won else -WIN_SCORE - depth
+    if depth == 0:
+        return evaluate(board)
+
+    moves = board.get_legal_moves()
+    if not moves:
+        return 0
+
+    best = -WIN_SCORE - depth - 1
+    for move in order_moves(board, moves):
+        child = board.copy()
+        child.make_move(*move)
+        score = -negamax(child, depth - 1, -beta, -alpha, counter)
+        if score > best:
+            best = score
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+    return best
+
+
+def order_moves(board, moves):
+    """Puts captures first, since they decide most atomic games and cut the search early"""
+    occupied = {square for square, _, _ in board.get_snapshot()[1]}
+    return sorted(moves, key=lambda move: move[1] not in occupied)
+
+
+def root_board(position):
+    """Sets up a board on a ChessVar or a snapshot. A ChessVar also passes on the draw counters of its game"""
+    board = MailboxBoard()
+    if isinstance(position, tuple):
+        board.restore_snapshot(position)
+        return board
+    from ChessVar import is_irreversible
+
+    # Replaying from a checkpoint at or before the last capture or pawn move rebuilds the counters exactly
+    ply = position.get_ply()
+    last_irreversible = next((previous for previous in range(ply, 0, -1)
+                              if is_irreversible(position.get_move_record(previous))), 0)
+    checkpoint_ply, snapshot = position.get_checkpoint(last_irreversible)
+    board.restore_snapshot(snapshot)
+    for replay_ply in range(checkpoint_ply + 1, ply + 1):
+        record = position.get_move_record(replay_ply)
+        board.make_move(record.get_source(), record.get_destination())
+    return board
+
+
+def _analyse_move(board, move, depth):
+    """Searches one root move in a worker process and gets (source, destination, score, nodes, seconds)"""
+    start = time.perf_counter()
+    board = board.copy()
+    board.make_move(*move)
+    counter = [0]
+    score = -negamax(board, depth - 1, -WIN_SCORE - depth - 1, WIN_SCORE + depth + 1, counter)
+    return move[0], move[1], score, counter[0], time.perf_counter() - start
+
+
+# ANALYSER CLASS
+class Analyser:
+    """Keeps a process pool ready and scores root moves in parallel, one subtree per task"""
+
+    def __init__(self, workers=None):
+        self._workers = workers or os.cpu_count() or 1
+        self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shuts the worker processes down"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def analyse(self, position, depth=DEFAULT_DEPTH):
+        """Gets (source, destination, score, nodes, seconds) for every legal move, best score first.
+
+        position is a ChessVar or one of its snapshots. Scores are in centipawns for the player to move.
+        A ChessVar brings its repetitions and fifty-move count, a snapshot starts them over.
+        Each root move is searched with a full window, so workers never wait on each other.
+        """
+        if depth < 1:
+            raise ValueError("Depth must be at least 1.")
+        board = root_board(position)
+        if board.get_game_state() != 'UNFINISHED':
+            return []
+        moves = order_moves(board, board.get_legal_moves())
+
+        if self._workers == 1:
+            results = [_analyse_move(board, move, depth) for move in moves]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._workers)
+            futures = [self._executor.submit(_analyse_move, board, move, depth) for move in moves]
+            try:
+                results = [future.result() for future in as_completed(futures)]
+            finally:
+                # After a failure the subtrees still queued are no longer wanted
+                for future in futures:
+                    future.cancel()
+
+        # Equal scores keep the move order of the board
+        order = {move: index for index, move in enumerate(moves)}
+        return sorted(results, key=lambda result: (-result[2], order[result[:2]]))
+
+
+def analyse(position, depth=DEFAULT_DEPTH, workers=None):
+    """Scores every legal move of a position using a one-off process pool"""
+    with Analyser(workers) as analyser:
+        return analyser.analyse(position, depth)
+
+
+# MAIN
+def main():
+    from ChessBook import parse_moves
+    from ChessVar import ChessVar
+
+    parser = argparse.ArgumentParser(description="Score every legal move of a position.")
+    parser.add_argument('moves', nargs='?', default='', help="moves leading to the position, written like 'a2a4'")
+    parser.add_argument('--depth', type=int, default=DEFAULT_DEPTH, help="search depth in plies")
+    parser.add_argument('--workers', type=int, default=None, help="search processes (defaults to all cores)")
+    args = parser.parse_args()
+
+    game = ChessVar(verbose=False)
+    for move in parse_moves(args.moves):
+        if not game.make_move(*move):
+            raise SystemExit(f"Move {move[0]}{move[1]} is not legal.")
+
+    start = time.perf_counter()
+    results = analyse(game, args.depth, args.workers)
+    for src_square, dest_square, score, nodes, seconds in results:
+        print(f"{src_square}{dest_square}  {score:>7}  {nodes:>9,} nodes  {seconds * 1000:>8.1f} ms")
+    total_nodes = sum(result[3] for result in results)
+    print(f"{len(results)} moves, {total_nodes:,} nodes in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
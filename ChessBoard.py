@@ -3,36 +3,117 @@
 # Date: 5/25/24
 # Description: Chessboard
 
-from ChessPieces import *
+from ChessPieces import Pawn, Rook, Knight, Bishop, Queen, King, verify_move
+
+
+# POSITION HASHING
+SQUARE_NAMES = [f"{col}{row}" for row in range(1, 9) for col in 'abcdefgh']
+
+
+def _zobrist_keys(count, seed=52524):
+    """Generates 64-bit keys with SplitMix64, so hashes agree across processes and stored files"""
+    mask = 0xFFFFFFFFFFFFFFFF
+    keys = []
+    state = seed
+    for _ in range(count):
+        state = (state + 0x9E3779B97F4A7C15) & mask
+        key = ((state ^ (state >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        key = ((key ^ (key >> 27)) * 0x94D049BB133111EB) & mask
+        keys.append(key ^ (key >> 31))
+    return keys
+
+
+_keys = iter(_zobrist_keys(13 * 64 + 1))
+ZOBRIST_PIECES = {
+    f"{color}{letter}": {square: next(_keys) for square in SQUARE_NAMES} for color in 'WB' for letter in 'PRNBQK'
+}
+ZOBRIST_UNMOVED_PAWNS = {square: next(_keys) for square in SQUARE_NAMES}
+ZOBRIST_BLACK_TO_MOVE = next(_keys)
+
+
+# Squares touching each square, the ones an explosion there can clear
+SQUARE_NEIGHBOURS = {
+    square: tuple(SQUARE_NAMES[row * 8 + col]
+                  for row in range(max(0, index // 8 - 1), min(8, index // 8 + 2))
+                  for col in range(max(0, index % 8 - 1), min(8, index % 8 + 2))
+                  if row * 8 + col != index)
+    for index, square in enumerate(SQUARE_NAMES)
+}
+
+
+def square_hash(piece, square):
+    """Gets the Zobrist contribution of a piece (or None) standing on a square"""
+    if piece is None:
+        return 0
+    hash_value = ZOBRIST_PIECES[str(piece)][square]
+    # Pawns that have not moved yet may still advance two squares
+    if isinstance(piece, Pawn) and not piece.has_moved():
+        hash_value ^= ZOBRIST_UNMOVED_PAWNS[square]
+    return hash_value
+
+
+def position_hash(board, player_turn):
+    """Computes the 64-bit Zobrist hash of a board and the player to move"""
+    hash_value = ZOBRIST_BLACK_TO_MOVE if player_turn == 'BLACK' else 0
+    for square, piece in board.items():
+        hash_value ^= square_hash(piece, square)
+    return hash_value
 
 
 # CHESS BOARD CLASS
 class ChessBoard:
     """Creates a chessboard"""
-    def __init__(self):
+
+    def __init__(self, verbose=True):
         self._board = {}
+        # Games that run silently turn off the messages of rejected moves too
+        self._verbose = verbose
+        # The dictionary and pieces of the starting position, put back in place by every reset
+        self._home_board = self._board
+        self._home_pieces = (
+            ('a1', Rook('WHITE')), ('b1', Knight('WHITE')), ('c1', Bishop('WHITE')), ('d1', Queen('WHITE')),
+            ('e1', King('WHITE')), ('f1', Bishop('WHITE')), ('g1', Knight('WHITE')), ('h1', Rook('WHITE')),
+            ('a2', Pawn('WHITE')), ('b2', Pawn('WHITE')), ('c2', Pawn('WHITE')), ('d2', Pawn('WHITE')),
+            ('e2', Pawn('WHITE')), ('f2', Pawn('WHITE')), ('g2', Pawn('WHITE')), ('h2', Pawn('WHITE')),
+            ('a8', Rook('BLACK')), ('b8', Knight('BLACK')), ('c8', Bishop('BLACK')), ('d8', Queen('BLACK')),
+            ('e8', King('BLACK')), ('f8', Bishop('BLACK')), ('g8', Knight('BLACK')), ('h8', Rook('BLACK')),
+            ('a7', Pawn('BLACK')), ('b7', Pawn('BLACK')), ('c7', Pawn('BLACK')), ('d7', Pawn('BLACK')),
+            ('e7', Pawn('BLACK')), ('f7', Pawn('BLACK')), ('g7', Pawn('BLACK')), ('h7', Pawn('BLACK')),
+        )
         self.reset_board()
 
+    def set_verbose(self, verbose):
+        """Turns the console messages on or off"""
+        self._verbose = verbose
+
+    def report(self, message):
+        """Prints a message to the console unless the board is silenced"""
+        if self._verbose:
+            print(message)
+
     def get_board(self):
         """Gets board"""
         return self._board
 
+    def set_board(self, board):
+        """Sets board to a dictionary of positions and chess pieces"""
+        self._board = board
+
     def reset_board(self):
         """Resets board to default state."""
 
         # Use dictionary to pair each board position with a default position for chess pieces
         # Use dictionary to dynamically update positions on the board
         # The dictionary does not contain empty spaces for memory efficiency
-        self._board = {
-            'a1': Rook('WHITE'), 'b1': Knight('WHITE'), 'c1': Bishop('WHITE'), 'd1': Queen('WHITE'),
-            'e1': King('WHITE'), 'f1': Bishop('WHITE'), 'g1': Knight('WHITE'), 'h1': Rook('WHITE'),
-            'a2': Pawn('WHITE'), 'b2': Pawn('WHITE'), 'c2': Pawn('WHITE'), 'd2': Pawn('WHITE'),
-            'e2': Pawn('WHITE'), 'f2': Pawn('WHITE'), 'g2': Pawn('WHITE'), 'h2': Pawn('WHITE'),
-            'a8': Rook('BLACK'), 'b8': Knight('BLACK'), 'c8': Bishop('BLACK'), 'd8': Queen('BLACK'),
-            'e8': King('BLACK'), 'f8': Bishop('BLACK'), 'g8': Knight('BLACK'), 'h8': Rook('BLACK'),
-            'a7': Pawn('BLACK'), 'b7': Pawn('BLACK'), 'c7': Pawn('BLACK'), 'd7': Pawn('BLACK'),
-            'e7': Pawn('BLACK'), 'f7': Pawn('BLACK'), 'g7': Pawn('BLACK'), 'h7': Pawn('BLACK'),
-        }
+        # The same dictionary and piece objects are reused, so a reset creates no new pieces.
+        # Refilling from empty keeps the square order of a new board, which move generation follows
+        board = self._home_board
+        board.clear()
+        for square, piece in self._home_pieces:
+            board[square] = piece
+            if isinstance(piece, Pawn):
+                piece.set_has_moved(False)
+        self._board = board
 
     def move_piece(self, src_pos, dest_pos, player_color):
         """Moves piece on a board"""
@@ -41,25 +122,38 @@ class ChessBoard:
         dest_pos_lower = dest_pos.lower()
 
         if src_pos_lower not in self._board:
-            raise ValueError("Source position is not valid.")
+            # raise ValueError("Source position is not valid.")
+            self.report("Source position is not valid.")
+            return False
 
         piece = self._board.get(src_pos_lower)
         piece_move_verify = verify_move(piece, src_pos_lower, dest_pos_lower, self._board)
 
         if not piece:
-            raise ValueError("There is no piece at source position.")
+            # raise ValueError("There is no piece at source position.")
+            self.report("There is no piece at source position.")
+            return False
 
         # Check if piece can move to location
         if not piece_move_verify:
-            raise ExecutionError("Piece cannot move to an invalid location. Check if path is clear or allowed "
-                                 "movement patterns for specific piece type according to traditional chess rules.")
+            # raise ExecutionError("Piece cannot move to an invalid location. Path has to be clear for piece to move "
+            #                      "(except for Knights) OR destined location is based on allowed movement"
+            #                      " patterns for specific piece type according to traditional chess rules.")
+            self.report("Piece cannot move to an invalid location. Path has to be clear for piece to move "
+                        "(except for Knights) OR destined location is based on allowed movement"
+                        " patterns for specific piece type according to traditional chess rules.")
+            return False
 
         dest_piece = self._board.get(dest_pos_lower)
         if dest_piece:
             if dest_piece.get_color() == player_color:
-                raise ValueError("Cannot capture own piece.")
+                # raise ValueError("Cannot capture own piece.")
+                self.report("Cannot capture own piece.")
+                return False
+
             else:
                 self.capture(src_pos_lower, dest_pos_lower, piece)
+                return True
 
         else:
             # Update the destination position with capturing piece, if dest is empty
@@ -72,6 +166,8 @@ class ChessBoard:
         if isinstance(piece, Pawn):
             piece.set_has_moved()
 
+        return True
+
     def capture(self, src_pos, dest_pos, piece):
         """Source piece replaces destination piece"""
         del self._board[dest_pos.lower()]
@@ -87,27 +183,6 @@ class ChessBoard:
 
     def print_board(self):
         """Prints board to console"""
-
-        # Top Border and Label
-        pipe_sep = " | "
-        print("       " + "     ".join("abcdefgh"))
-        print("    " + "+" + "-----+" * 8)  # Prints 8 times for number of rows
-        for row in range(8, 0, -1):
-            # Prints row number first
-            print(row, ' ', end=pipe_sep)  # Override default 'end' for print() method
-
-            # Since columns are labeled letters, we need to use the ASCII values of the character labels
-            for col in range(97, 105):
-                column_pos = chr(col)  # col is converted to string character based on the ASCII ranges in the for loop
-
-                # For example, c(col) + 8(row) is retrieved from the board dictionary as 'c8'
-                # Get chess piece from dictionary board
-                piece = self._board.get(f"{column_pos}{row}")
-
-                # If there is a piece in the position it gets __str__ of Piece, else it is an empty space
-                piece_str = str(piece) if piece else ' '
-                print("{:^3}".format(piece_str), end=pipe_sep)
-            print("  ", row)
-            print("    " + "+" + "-----+" * 8)
-        # Bottom Label
-        print("       " + "     ".join("abcdefgh"))
+        # Rendering is only loaded by callers that actually print a board
+        from ChessRender import print_board
+        print_board(self._board)
@@ -0,0 +1,145 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Opening book built from atomic games and probed through a memory-mapped file
+
+import argparse
+import mmap
+import struct
+from collections import Counter
+
+from ChessVar import ChessVar
+
+
+# BOOK LAYOUT
+# An 8 byte header is followed by fixed-size records sorted by position hash,
+# and by weight (highest first) within one hash:
+#   uint64 position hash | uint8 source square | uint8 destination square | uint16 weight
+MAGIC = b'ABK1\0\0\0\0'
+HEADER_SIZE = len(MAGIC)
+RECORD = struct.Struct('<QBBH')
+MAX_WEIGHT = 0xFFFF
+
+COLUMNS = 'abcdefgh'
+SQUARES = [f"{col}{row}" for row in range(1, 9) for col in COLUMNS]
+SQUARE_INDEX = {square: index for index, square in enumerate(SQUARES)}
+
+
+# CORPUS HELPERS
+def parse_moves(line):
+    """Parses a line of moves such as 'a2a4 g7g5' into (source, destination) pairs"""
+    moves = []
+    for token in line.split():
+        token = token.lower()
+        if len(token) != 4 or token[:2] not in SQUARE_INDEX or token[2:] not in SQUARE_INDEX:
+            raise ValueError(f"'{token}' is not a move such as 'a2a4'.")
+        moves.append((token[:2], token[2:]))
+    return moves
+
+
+def read_games(path):
+    """Reads a corpus file holding one game per line, skipping blank lines and '#' comments"""
+    with open(path) as corpus:
+        for line in corpus:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                yield parse_moves(line)
+
+
+# BUILDING
+def build_book(games, path, max_plies=20, min_count=1):
+    """Writes a book holding how often each move was played in the first plies of the games"""
+    counts = Counter()
+    for moves in games:
+        game = ChessVar(verbose=False)
+        for src_square, dest_square in moves[:max_plies]:
+            # Stop at the first move the rules do not allow, the rest of the game is unreliable
+            if (src_square, dest_square) not in game.get_legal_moves():
+                break
+            counts[(game.get_position_hash(), SQUARE_INDEX[src_square], SQUARE_INDEX[dest_square])] += 1
+            game.make_move(src_square, dest_square)
+            if game.get_game_state() != 'UNFINISHED':
+                break
+
+    records = sorted(
+        ((hash_value, src, dest, min(count, MAX_WEIGHT))
+         for (hash_value, src, dest), count in counts.items() if count >= min_count),
+        key=lambda record: (record[0], -record[3], record[1], record[2]))
+
+    with open(path, 'wb') as book_file:
+        book_file.write(MAGIC)
+        for record in records:
+            book_file.write(RECORD.pack(*record))
+    return len(records)
+
+
+# PROBING
+class OpeningBook:
+    """Looks up book moves by binary search over a memory-mapped book file"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as book_file:
+            # Empty books cannot be memory-mapped past their header, so they are kept as bytes
+            size = book_file.seek(0, 2)
+            if size > HEADER_SIZE:
+                self._data = mmap.mmap(book_file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                book_file.seek(0)
+                self._data = book_file.read()
+
+        if self._data[:HEADER_SIZE] != MAGIC:
+            raise ValueError(f"{path} is not an opening book file.")
+        self._count = (len(self._data) - HEADER_SIZE) // RECORD.size
+
+    def __len__(self):
+        return self._count
+
+    def probe(self, game):
+        """Gets (source, destination, weight) book moves for the current position, best first"""
+        return self.probe_hash(game.get_position_hash())
+
+    def probe_hash(self, hash_value):
+        """Gets (source, destination, weight) book moves stored under a position hash"""
+        # Lower bound search for the first record of this hash
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._hash_at(middle) < hash_value:
+                low = middle + 1
+            else:
+                high = middle
+
+        moves = []
+        while low < self._count:
+            record_hash, src, dest, weight = RECORD.unpack_from(self._data, HEADER_SIZE + low * RECORD.size)
+            if record_hash != hash_value:
+                break
+            moves.append((SQUARES[src], SQUARES[dest], weight))
+            low += 1
+        return moves
+
+    def close(self):
+        """Closes the memory map"""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def _hash_at(self, position):
+        """Reads the hash of one record"""
+        return struct.unpack_from('<Q', self._data, HEADER_SIZE + position * RECORD.size)[0]
+
+
+# MAIN
+def main():
+    parser = argparse.ArgumentParser(description="Build an atomic opening book from a corpus of games.")
+    parser.add_argument('corpus', help="text file with one game per line, moves written like 'a2a4'")
+    parser.add_argument('book', help="book file to write")
+    parser.add_argument('--max-plies', type=int, default=20, help="plies of each game to keep")
+    parser.add_argument('--min-count', type=int, default=1, help="drop moves played fewer times")
+    args = parser.parse_args()
+
+    count = build_book(read_games(args.corpus), args.book, args.max_plies, args.min_count)
+    print(f"Wrote {count} book moves to {args.book}")
+
+
+if __name__ == '__main__':
+    main()
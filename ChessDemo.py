@@ -0,0 +1,70 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 5/25/24
+# Description: Demo games for the Chessboard Variant (Atomic) Game
+
+from ChessVar import ChessVar
+
+
+# MAIN CLASSES
+def main():
+    game1 = ChessVar()
+
+    print("--------------------------------------------------------------------------------")
+    game1.make_move('a2', 'a3')  # WHITE - PAWN MOVES
+    game1.make_move('f7', 'f5')  # BLACK - PAWN MOVES
+    game1.make_move('a3', 'a4')  # WHITE - PAWN MOVES
+    game1.make_move('f5', 'f4')  # BLACK - PAWN MOVES
+
+    game1.make_move('a1', 'a3')  # WHITE - ROOK MOVES
+    game1.make_move('c7', 'c5')  # BLACK - PAWN MOVES
+    game1.make_move('a3', 'h3')  # WHITE - ROOK MOVES
+    game1.make_move('b8', 'c6')  # BLACK - KNIGHT MOVES
+
+    game1.make_move('b1', 'a3')  # WHITE - KNIGHT MOVES
+    game1.make_move('b7', 'b5')  # BLACK - PAWN MOVES
+    game1.make_move('b2', 'b4')  # WHITE - PAWN MOVES
+    game1.make_move('c8', 'b7')  # BLACK - BISHOP MOVES
+
+    game1.make_move('f2', 'f3')  # WHITE - PAWN MOVES
+    game1.make_move('d8', 'a5')  # BLACK - QUEEN MOVES
+    game1.make_move('b4', 'c5')  # WHITE - PAWN MOVES & CAPTURES PAWN + EXPLODE
+    game1.make_move('d7', 'd5')  # BLACK - PAWN MOVES
+
+    game1.make_move('h3', 'h7')  # WHITE - ROOK MOVES & CAPTURES PAWN + EXPLODE
+    game1.make_move('e8', 'd8')  # BLACK - KING MOVES
+    game1.make_move('a4', 'b5')  # WHITE - PAWN MOVES & CAPTURES PAWN + EXPLODE
+    game1.make_move('d8', 'c8')  # BLACK - KING MOVES
+
+    game1.make_move('a3', 'b5')  # WHITE - KNIGHT MOVES
+    game1.make_move('c8', 'b8')  # BLACK - KING MOVES
+    game1.make_move('b5', 'a7')  # WHITE - KNIGHT MOVES & CAPTURES PAWN + EXPLODE = KING DEAD
+
+    game1.print_board()
+
+    game2 = ChessVar()
+    # GAME 2
+    game2.make_move('a2', 'a3')  # WHITE
+    # print(game2.make_move('a1', 'a5'))
+    game2.make_move('a7', 'a6')  # BLACK
+    game2.make_move('h2', 'h4')  # WHITE
+    game2.make_move('d7', 'd5')  # BLACK
+
+    game2.make_move('h1', 'h3')  # WHITE
+    game2.make_move('b8', 'c6')  # BLACK
+    game2.make_move('a1', 'a2')  # WHITE
+    game2.make_move('c8', 'h3')  # BLACK
+
+    game2.make_move('g1', 'h3')  # WHITE
+
+    game2.print_board()
+
+    # game_readme_test = ChessVar()
+    # print(game_readme_test.make_move('a2', 'a4'))  # output True
+    # print(game_readme_test.make_move('g7', 'g5'))  # output True
+    # game_readme_test.print_board()
+    # print(game_readme_test.get_game_state())  # output UNFINISHED
+
+
+if __name__ == '__main__':
+    main()
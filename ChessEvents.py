@@ -0,0 +1,102 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Compact board-diff events sent to spectators after every move
+
+COLUMNS = 'abcdefgh'
+SQUARES = [f"{col}{row}" for row in range(1, 9) for col in COLUMNS]
+SQUARE_INDEX = {square: index for index, square in enumerate(SQUARES)}
+PIECE_CODES = ('WP', 'WN', 'WB', 'WR', 'WQ', 'WK', 'BP', 'BN', 'BB', 'BR', 'BQ', 'BK')
+PIECE_INDEX = {code: index for index, code in enumerate(PIECE_CODES)}
+RESULT_CODES = ('UNFINISHED', 'WHITE_WON', 'BLACK_WON', 'DRAW')
+
+
+# BOARD DIFF CLASS
+class BoardDiff:
+    """Squares changed by one move, the player to move next and the game state"""
+
+    __slots__ = ('_vacated', '_filled', '_exploded', '_player_turn', '_result')
+
+    def __init__(self, vacated, filled, exploded, player_turn, result):
+        self._vacated = vacated
+        self._filled = filled
+        self._exploded = exploded
+        self._player_turn = player_turn
+        self._result = result
+
+    def __eq__(self, other):
+        return isinstance(other, BoardDiff) and self._as_tuple() == other._as_tuple()
+
+    def __repr__(self):
+        return f"BoardDiff({self._vacated!r}, {self._filled!r}, {self._exploded!r}, " \
+               f"{self._player_turn!r}, {self._result!r})"
+
+    @classmethod
+    def from_record(cls, record, player_turn):
+        """Builds the diff of a move record"""
+        vacated = [record.get_source()]
+        filled = ()
+        if record.get_captured():
+            # The captor explodes on the destination square along with what it captured
+            vacated.append(record.get_destination())
+        else:
+            filled = ((record.get_destination(), record.get_piece()),)
+        vacated.extend(square for square, _ in record.get_exploded())
+        return cls(tuple(vacated), filled, record.get_exploded(), player_turn, record.get_result())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Decodes a diff written by to_bytes"""
+        flags = data[0]
+        position = 1
+
+        vacated_count = data[position]
+        vacated = tuple(SQUARES[square] for square in data[position + 1:position + 1 + vacated_count])
+        position += 1 + vacated_count
+
+        pairs = []
+        for _ in range(2):
+            pair_count = data[position]
+            pair_bytes = data[position + 1:position + 1 + 2 * pair_count]
+            pairs.append(tuple((SQUARES[pair_bytes[index]], PIECE_CODES[pair_bytes[index + 1]])
+                               for index in range(0, len(pair_bytes), 2)))
+            position += 1 + 2 * pair_count
+
+        player_turn = 'BLACK' if flags & 1 else 'WHITE'
+        return cls(vacated, pairs[0], pairs[1], player_turn, RESULT_CODES[flags >> 1])
+
+    def to_bytes(self):
+        """Encodes the diff in a few bytes: flags, then counted lists of squares and (square, piece) pairs"""
+        data = bytearray([(RESULT_CODES.index(self._result) << 1) | (self._player_turn == 'BLACK')])
+        data.append(len(self._vacated))
+        data.extend(SQUARE_INDEX[square] for square in self._vacated)
+        for pairs in (self._filled, self._exploded):
+            data.append(len(pairs))
+            for square, code in pairs:
+                data.append(SQUARE_INDEX[square])
+                data.append(PIECE_INDEX[code])
+        return bytes(data)
+
+    def get_vacated(self):
+        """Gets squares that are empty after the move"""
+        return self._vacated
+
+    def get_filled(self):
+        """Gets (square, piece code) pairs of squares that hold a new piece after the move"""
+        return self._filled
+
+    def get_exploded(self):
+        """Gets (square, piece code) pairs of pieces removed by the explosion around the captor"""
+        return self._exploded
+
+    def get_player_turn(self):
+        """Gets player turn after the move"""
+        return self._player_turn
+
+    def get_result(self):
+        """Gets game state after the move"""
+        return self._result
+
+    def _as_tuple(self):
+        """Gets the fields as a tuple for comparisons"""
+        return self._vacated, self._filled, self._exploded, self._player_turn, self._result
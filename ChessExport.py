@@ -0,0 +1,156 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Streams positions of replayed games into sharded numpy files for model training
+
+import argparse
+import os
+
+import numpy as np
+
+from ChessBook import read_games
+from ChessVar import ChessVar
+
+# Plane order of the piece codes, one 8x8 plane each
+PLANE_CODES = ('WP', 'WN', 'WB', 'WR', 'WQ', 'WK', 'BP', 'BN', 'BB', 'BR', 'BQ', 'BK')
+PLANE_INDEX = {code: index for index, code in enumerate(PLANE_CODES)}
+EMPTY = len(PLANE_CODES)
+
+COLUMNS = 'abcdefgh'
+SQUARE_INDEX = {f"{col}{row}": (row - 1) * 8 + index for row in range(1, 9) for index, col in enumerate(COLUMNS)}
+
+# Game results from WHITE's point of view
+RESULT_VALUES = {'WHITE_WON': 1, 'BLACK_WON': -1}
+
+DEFAULT_SHARD_SIZE = 65536
+
+
+# ENCODING
+def encode_planes(squares):
+    """Turns an (n, 64) array of plane indexes (EMPTY for no piece) into (n, 12, 8, 8) one-hot planes"""
+    planes = squares[:, None, :] == np.arange(len(PLANE_CODES), dtype=np.uint8)[None, :, None]
+    return planes.reshape(len(squares), len(PLANE_CODES), 8, 8).astype(np.uint8)
+
+
+# SHARD WRITER CLASS
+class ShardWriter:
+    """Buffers positions in compact byte rows and writes a shard each time shard_size records are buffered.
+
+    Each shard is an .npz file holding
+        planes        uint8 (n, 12, 8, 8)   one plane per piece type and color, row 0 is rank 1
+        side_to_move  uint8 (n,)            0 for WHITE, 1 for BLACK
+        pawn_moved    uint8 (n, 8, 8)       1 where a pawn stands that has already moved
+        result        int8  (n,)            1 WHITE won, -1 BLACK won, 0 otherwise
+    """
+
+    def __init__(self, directory, prefix='positions', shard_size=DEFAULT_SHARD_SIZE, compressed=False):
+        if shard_size < 1:
+            raise ValueError("Shard size must be at least 1.")
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._prefix = prefix
+        self._shard_size = shard_size
+        self._save = np.savez_compressed if compressed else np.savez
+        self._paths = []
+        self._reset_buffers()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def get_paths(self):
+        """Gets paths of the shards written so far"""
+        return list(self._paths)
+
+    def add_game(self, moves):
+        """Replays a game and adds the position before every move, labelled with the game result"""
+        game = ChessVar(verbose=False)
+        rows = []
+        for src_square, dest_square in moves:
+            if game.get_game_state() != 'UNFINISHED':
+                break
+            position = self._encode(game)
+            if not game.make_move(src_square, dest_square):
+                break
+            rows.append(position)
+
+        result = RESULT_VALUES.get(game.get_game_state(), 0)
+        for squares, side_to_move, pawn_moved in rows:
+            self._squares += squares
+            self._pawn_moved += pawn_moved
+            self._side_to_move.append(side_to_move)
+            self._results.append(result)
+            if len(self._results) >= self._shard_size:
+                self.flush()
+        return len(rows)
+
+    def flush(self):
+        """Writes buffered positions to a new shard, vectorizing the plane encoding over the whole batch"""
+        count = len(self._results)
+        if not count:
+            return None
+
+        squares = np.frombuffer(bytes(self._squares), dtype=np.uint8).reshape(count, 64)
+        path = os.path.join(self._directory, f"{self._prefix}-{len(self._paths):05d}.npz")
+        self._save(
+            path,
+            planes=encode_planes(squares),
+            side_to_move=np.frombuffer(bytes(self._side_to_move), dtype=np.uint8),
+            pawn_moved=np.frombuffer(bytes(self._pawn_moved), dtype=np.uint8).reshape(count, 8, 8),
+            result=np.array(self._results, dtype=np.int8),
+        )
+        self._paths.append(path)
+        self._reset_buffers()
+        return path
+
+    def close(self):
+        """Writes the last, possibly smaller, shard"""
+        self.flush()
+
+    def _encode(self, game):
+        """Encodes one position as (64 plane indexes, side to move, 64 pawn moved flags) byte rows"""
+        squares = bytearray([EMPTY]) * 64
+        pawn_moved = bytearray(64)
+        for square, piece in game.get_board().items():
+            index = SQUARE_INDEX[square]
+            code = str(piece)
+            squares[index] = PLANE_INDEX[code]
+            if code[1] == 'P' and piece.has_moved():
+                pawn_moved[index] = 1
+        return squares, 0 if game.get_player_turn() == 'WHITE' else 1, pawn_moved
+
+    def _reset_buffers(self):
+        """Starts an empty batch"""
+        self._squares = bytearray()
+        self._pawn_moved = bytearray()
+        self._side_to_move = bytearray()
+        self._results = []
+
+
+def export_games(games, directory, prefix='positions', shard_size=DEFAULT_SHARD_SIZE, compressed=False):
+    """Streams games (lists of (source, destination) moves) into shards and gets the shard paths"""
+    with ShardWriter(directory, prefix, shard_size, compressed) as writer:
+        for moves in games:
+            writer.add_game(moves)
+    return writer.get_paths()
+
+
+# MAIN
+def main():
+    parser = argparse.ArgumentParser(description="Export positions of a game corpus as numpy training shards.")
+    parser.add_argument('corpus', help="text file with one game per line, moves written like 'a2a4'")
+    parser.add_argument('directory', help="directory for the shard files")
+    parser.add_argument('--prefix', default='positions', help="shard file name prefix")
+    parser.add_argument('--shard-size', type=int, default=DEFAULT_SHARD_SIZE, help="records per shard")
+    parser.add_argument('--compressed', action='store_true', help="write compressed shards")
+    args = parser.parse_args()
+
+    for path in export_games(read_games(args.corpus), args.directory, args.prefix, args.shard_size,
+                             args.compressed):
+        print(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Thread-safe manager for many concurrent atomic chess games
+
+import itertools
+import threading
+from contextlib import contextmanager
+from types import MappingProxyType
+
+from ChessVar import ChessVar
+
+
+# SNAPSHOT CLASS
+class GameSnapshot:
+    """Read-only copy of a game taken after its latest move"""
+
+    __slots__ = ('_board', '_player_turn', '_game_state')
+
+    def __init__(self, game):
+        # Pieces are stored by their string code so readers never touch live piece objects
+        self._board = MappingProxyType({square: str(piece) for square, piece in game.get_board().items()})
+        self._player_turn = game.get_player_turn()
+        self._game_state = game.get_game_state()
+
+    def get_board(self):
+        """Gets read-only dictionary of positions and piece codes such as 'WP'"""
+        return self._board
+
+    def get_player_turn(self):
+        """Gets player turn"""
+        return self._player_turn
+
+    def get_game_state(self):
+        """Gets game state"""
+        return self._game_state
+
+
+# GAME MANAGER CLASS
+class GameManager:
+    """Holds many games, each behind its own lock so moves on different games run in parallel"""
+
+    def __init__(self, pool=None):
+        self._games = {}
+        # Optional GamePool that supplies new games and takes removed ones back
+        self._pool = pool
+        self._locks = {}
+        self._snapshots = {}
+        # Only guards adding and removing games, never a move
+        self._registry_lock = threading.Lock()
+        self._game_ids = itertools.count(1)
+
+    def create_game(self, game_id=None, verbose=False):
+        """Creates a new game and returns its id"""
+        game = self._pool.acquire(verbose) if self._pool is not None else ChessVar(verbose=verbose)
+        with self._registry_lock:
+            if game_id is None:
+                game_id = next(self._game_ids)
+                while game_id in self._games:
+                    game_id = next(self._game_ids)
+            elif game_id in self._games:
+                if self._pool is not None:
+                    self._pool.release(game)
+                raise ValueError(f"Game {game_id} already exists.")
+
+            self._locks[game_id] = threading.Lock()
+            self._snapshots[game_id] = GameSnapshot(game)
+            self._games[game_id] = game
+        return game_id
+
+    def remove_game(self, game_id):
+        """Removes a game once no move is running on it, handing it back to the pool if there is one"""
+        lock = self._get_lock(game_id)
+        with lock, self._registry_lock:
+            self._check_lock(game_id, lock)
+            game = self._games.pop(game_id)
+            del self._locks[game_id]
+            del self._snapshots[game_id]
+        if self._pool is not None:
+            self._pool.release(game)
+
+    def get_game_ids(self):
+        """Gets ids of all games"""
+        return list(self._games)
+
+    def make_move(self, game_id, src_square, dest_square):
+        """Makes a move while holding only this game's lock"""
+        with self.locked_game(game_id) as game:
+            return game.make_move(src_square, dest_square)
+
+    @contextmanager
+    def locked_game(self, game_id):
+        """Gives exclusive access to a game and publishes a fresh snapshot when done"""
+        lock = self._get_lock(game_id)
+        with lock:
+            self._check_lock(game_id, lock)
+            game = self._games[game_id]
+            try:
+                yield game
+            finally:
+                # Replacing the dictionary entry is a single atomic step, readers see the old or the new snapshot
+                self._snapshots[game_id] = GameSnapshot(game)
+
+    def get_snapshot(self, game_id):
+        """Gets the latest snapshot of a game without taking any lock"""
+        try:
+            return self._snapshots[game_id]
+        except KeyError:
+            raise ValueError(f"Game {game_id} does not exist.") from None
+
+    def get_game_state(self, game_id):
+        """Gets game state without taking any lock"""
+        return self.get_snapshot(game_id).get_game_state()
+
+    def get_player_turn(self, game_id):
+        """Gets player turn without taking any lock"""
+        return self.get_snapshot(game_id).get_player_turn()
+
+    def get_board(self, game_id):
+        """Gets read-only board view without taking any lock"""
+        return self.get_snapshot(game_id).get_board()
+
+    def _get_lock(self, game_id):
+        """Gets the lock of a game"""
+        try:
+            return self._locks[game_id]
+        except KeyError:
+            raise ValueError(f"Game {game_id} does not exist.") from None
+
+    def _check_lock(self, game_id, lock):
+        """Checks that a lock, acquired after waiting, still belongs to the game under this id"""
+        # The game may have been removed, and another one created under the same id, while waiting
+        if self._locks.get(game_id) is not lock:
+            raise ValueError(f"Game {game_id} does not exist.")
@@ -0,0 +1,97 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Pool of reusable ChessVar games that are reset in place instead of built again
+
+import threading
+from contextlib import contextmanager
+
+from ChessVar import ChessVar
+
+DEFAULT_MAX_SIZE = 256
+
+
+# GAME POOL CLASS
+class GamePool:
+    """Hands out games in the starting position, recycling released games instead of creating new ones"""
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE, preallocate=0):
+        if max_size < 0 or not 0 <= preallocate <= max_size:
+            raise ValueError("Pool size limits must satisfy 0 <= preallocate <= max_size.")
+        self._max_size = max_size
+        # Idle games, the most recently released one last so it is handed out while still warm in cache
+        self._idle = [ChessVar(verbose=False) for _ in range(preallocate)]
+        # Ids of idle games and of games being reset on their way in, a game released twice is refused
+        self._idle_ids = {id(game) for game in self._idle}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._discarded = 0
+
+    def __len__(self):
+        return len(self._idle)
+
+    def acquire(self, verbose=False):
+        """Gets a game in the starting position, recycled when one is idle"""
+        with self._lock:
+            if self._idle:
+                self._hits += 1
+                game = self._idle.pop()
+                self._idle_ids.discard(id(game))
+            else:
+                self._misses += 1
+                game = None
+
+        if game is None:
+            return ChessVar(verbose=verbose)
+        game.set_verbose(verbose)
+        return game
+
+    def release(self, game):
+        """Resets a game and keeps it for reuse. Gets False if the pool was full and the game was dropped.
+
+        The caller must not use the game afterwards, since it will be handed to someone else.
+        Releasing a game that is already in the pool raises ValueError.
+        """
+        with self._lock:
+            if id(game) in self._idle_ids:
+                raise ValueError("Game is already in the pool.")
+            if len(self._idle) >= self._max_size:
+                self._discarded += 1
+                return False
+            self._idle_ids.add(id(game))
+
+        # Reset outside the lock, acquire only ever pays for popping the list
+        game.reset()
+        with self._lock:
+            if len(self._idle) >= self._max_size:
+                self._idle_ids.discard(id(game))
+                self._discarded += 1
+                return False
+            self._idle.append(game)
+        return True
+
+    @contextmanager
+    def game(self, verbose=False):
+        """Gives a game for the duration of a with block and releases it afterwards"""
+        game = self.acquire(verbose)
+        try:
+            yield game
+        finally:
+            self.release(game)
+
+    def get_stats(self):
+        """Gets (hits, misses, discarded games, idle games)"""
+        return self._hits, self._misses, self._discarded, len(self._idle)
+
+    def get_hit_rate(self):
+        """Gets the share of acquired games that were recycled"""
+        acquired = self._hits + self._misses
+        return self._hits / acquired if acquired else 0.0
+
+    def clear(self):
+        """Drops every idle game"""
+        with self._lock:
+            for game in self._idle:
+                self._idle_ids.discard(id(game))
+            self._idle.clear()
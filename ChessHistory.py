@@ -0,0 +1,94 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Move history with position checkpoints for replaying atomic chess games
+
+# A checkpoint is stored every this many plies, so a seek replays at most this many moves
+CHECKPOINT_INTERVAL = 16
+
+
+# MOVE RECORD CLASS
+class MoveRecord:
+    """Records one move. Pieces are kept as string codes such as 'WP'"""
+
+    __slots__ = ('_src_square', '_dest_square', '_piece', '_captured', '_exploded', '_result')
+
+    def __init__(self, src_square, dest_square, piece, captured, exploded, result):
+        self._src_square = src_square
+        self._dest_square = dest_square
+        self._piece = piece
+        self._captured = captured
+        self._exploded = exploded
+        self._result = result
+
+    def __repr__(self):
+        return f"MoveRecord({self._src_square!r}, {self._dest_square!r}, {self._piece!r}, " \
+               f"{self._captured!r}, {self._exploded!r}, {self._result!r})"
+
+    def get_source(self):
+        """Gets source square"""
+        return self._src_square
+
+    def get_destination(self):
+        """Gets destination square"""
+        return self._dest_square
+
+    def get_piece(self):
+        """Gets code of the moved piece"""
+        return self._piece
+
+    def get_captured(self):
+        """Gets code of the captured piece, or None for a quiet move"""
+        return self._captured
+
+    def get_exploded(self):
+        """Gets (square, code) pairs of pieces removed by the explosion around the captor"""
+        return self._exploded
+
+    def get_result(self):
+        """Gets game state after the move"""
+        return self._result
+
+
+# MOVE HISTORY CLASS
+class MoveHistory:
+    """Keeps the moves of a game and a position snapshot every few plies"""
+
+    def __init__(self, start_snapshot, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self._records = []
+        self._checkpoint_interval = checkpoint_interval
+        # Checkpoint i holds the position after i * checkpoint_interval plies
+        self._checkpoints = [start_snapshot]
+
+    def __len__(self):
+        return len(self._records)
+
+    def reset(self, start_snapshot):
+        """Drops every move and checkpoint, keeping the lists for the next game"""
+        self._records.clear()
+        self._checkpoints.clear()
+        self._checkpoints.append(start_snapshot)
+
+    def get_records(self):
+        """Gets list of move records"""
+        return list(self._records)
+
+    def get_record(self, ply):
+        """Gets record of the move that led to a ply (ply 1 is the first move)"""
+        return self._records[ply - 1]
+
+    def append(self, record, get_snapshot):
+        """Adds a move, taking a checkpoint from get_snapshot() when one is due"""
+        self._records.append(record)
+        if len(self._records) % self._checkpoint_interval == 0:
+            self._checkpoints.append(get_snapshot())
+
+    def truncate(self, ply):
+        """Drops every move after a ply"""
+        del self._records[ply:]
+        del self._checkpoints[ply // self._checkpoint_interval + 1:]
+
+    def nearest_checkpoint(self, ply):
+        """Gets (checkpoint ply, snapshot) of the closest checkpoint at or before a ply"""
+        index = min(ply // self._checkpoint_interval, len(self._checkpoints) - 1)
+        return index * self._checkpoint_interval, self._checkpoints[index]
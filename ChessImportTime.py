@@ -0,0 +1,61 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Measures how long a fresh worker process takes to import the game
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Budget for "import ChessVar" in a fresh interpreter, in milliseconds
+IMPORT_BUDGET_MS = 15.0
+
+# Modules a worker should never pay for unless it asks for them
+LAZY_MODULES = ('ChessRender', 'ChessDemo')
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'seconds': elapsed, 'loaded': [name for name in {lazy!r} if name in sys.modules]}}))
+"""
+
+
+def measure_import(module='ChessVar', runs=15):
+    """Imports a module in fresh interpreters and returns (median milliseconds, eagerly loaded lazy modules)"""
+    code = _PROBE.format(module=module, lazy=LAZY_MODULES)
+    directory = os.path.dirname(os.path.abspath(__file__))
+
+    timings = []
+    loaded = set()
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], cwd=directory, check=True,
+                                capture_output=True, text=True).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        timings.append(result['seconds'] * 1000)
+        loaded.update(result['loaded'])
+    return statistics.median(timings), sorted(loaded)
+
+
+# MAIN
+def main():
+    parser = argparse.ArgumentParser(description="Check the import time of the game against a budget.")
+    parser.add_argument('--module', default='ChessVar', help="module a worker imports")
+    parser.add_argument('--runs', type=int, default=15, help="fresh interpreters to time")
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS, help="allowed median import time")
+    args = parser.parse_args()
+
+    median_ms, loaded = measure_import(args.module, args.runs)
+    print(f"import {args.module}: {median_ms:.2f} ms median over {args.runs} runs (budget {args.budget_ms:.2f} ms)")
+    if loaded:
+        print(f"Loaded eagerly but should be lazy: {', '.join(loaded)}")
+    if median_ms > args.budget_ms or loaded:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
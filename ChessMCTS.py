@@ -0,0 +1,276 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Monte Carlo tree search player with rollouts spread over worker processes
+
+import math
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from ChessVar import ChessVar
+
+COLUMNS = 'abcdefgh'
+SQUARES = [f"{col}{row}" for row in range(1, 9) for col in COLUMNS]
+SQUARE_INDEX = {square: index for index, square in enumerate(SQUARES)}
+
+# Rollout results are scored for WHITE: 1 win, 0 loss, 0.5 draw or cut off
+RESULT_SCORES = {'WHITE_WON': 1.0, 'BLACK_WON': 0.0}
+
+
+# ROLLOUTS
+_rollout_game = None
+
+
+def rollout(snapshot, max_plies, seed):
+    """Plays a lightly guided random game from a position snapshot and scores it for WHITE"""
+    global _rollout_game
+    if _rollout_game is None:
+        _rollout_game = ChessVar(verbose=False)
+    game = _rollout_game
+    game.restore_snapshot(snapshot)
+    rng = random.Random(seed)
+
+    for _ in range(max_plies):
+        game_state = game.get_game_state()
+        if game_state != 'UNFINISHED':
+            return RESULT_SCORES.get(game_state, 0.5)
+
+        moves = game.get_legal_moves()
+        if not moves:
+            return 0.5
+        game.make_move(*pick_rollout_move(game, moves, rng))
+
+    return RESULT_SCORES.get(game.get_game_state(), 0.5)
+
+
+def pick_rollout_move(game, moves, rng):
+    """Takes a capture on or next to the enemy King when one exists, otherwise a random move"""
+    board = game.get_board()
+    player_turn = game.get_player_turn()
+    enemy_king = own_king = None
+    for square, piece in board.items():
+        if str(piece)[1] == 'K':
+            if piece.get_color() == player_turn:
+                own_king = square
+            else:
+                enemy_king = square
+
+    if enemy_king:
+        for src_square, dest_square in moves:
+            # A capture next to a King blows it up, which only helps when it is not our own
+            if dest_square in board and _is_near(dest_square, enemy_king) and not _is_near(dest_square, own_king):
+                return src_square, dest_square
+    return rng.choice(moves)
+
+
+def _is_near(square, other_square):
+    """Checks if two squares are the same or touch each other"""
+    if other_square is None:
+        return False
+    return (abs(COLUMNS.index(square[0]) - COLUMNS.index(other_square[0])) <= 1
+            and abs(int(square[1]) - int(other_square[1])) <= 1)
+
+
+def _rollout_batch(tasks):
+    """Runs several rollouts in one worker call to save on process round trips"""
+    return [rollout(*task) for task in tasks]
+
+
+# SEARCH TREE
+class SearchTree:
+    """UCT tree kept in flat arrays. Node 0 is the root, children of a node are stored next to each other"""
+
+    def __init__(self):
+        self.parent = array('i', [-1])
+        self.src = array('B', [0])
+        self.dest = array('B', [0])
+        self.visits = array('l', [0])
+        # Score summed from the view of the player who made the move into the node
+        self.score = array('d', [0.0])
+        self.first_child = array('i', [-1])
+        self.child_count = array('H', [0])
+
+    def __len__(self):
+        return len(self.parent)
+
+    def expand(self, node, moves):
+        """Adds one child per move below a node"""
+        self.first_child[node] = len(self.parent)
+        self.child_count[node] = len(moves)
+        for src_square, dest_square in moves:
+            self.parent.append(node)
+            self.src.append(SQUARE_INDEX[src_square])
+            self.dest.append(SQUARE_INDEX[dest_square])
+            self.visits.append(0)
+            self.score.append(0.0)
+            self.first_child.append(-1)
+            self.child_count.append(0)
+
+    def children(self, node):
+        """Gets the range of child nodes"""
+        first = self.first_child[node]
+        return range(first, first + self.child_count[node]) if first >= 0 else range(0)
+
+    def move(self, node):
+        """Gets the (source, destination) move leading into a node"""
+        return SQUARES[self.src[node]], SQUARES[self.dest[node]]
+
+
+# MCTS PLAYER CLASS
+class MCTSPlayer:
+    """Chooses moves with UCT search, running rollouts in a process pool when given more than one worker"""
+
+    def __init__(self, workers=None, exploration=1.4, batch_size=None, rollout_plies=80, seed=None):
+        self._workers = workers or os.cpu_count() or 1
+        self._exploration = exploration
+        # Leaves gathered per round trip to the pool; more workers need more leaves in flight
+        self._batch_size = batch_size or (1 if self._workers == 1 else self._workers * 4)
+        self._rollout_plies = rollout_plies
+        self._rng = random.Random(seed)
+        self._executor = None
+        # Tree of the latest search, kept for its principal variation
+        self._tree = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Shuts down the rollout processes"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def choose_move(self, game, playouts=None, time_limit=None, stop_event=None):
+        """Gets the most visited (source, destination) move, or None if there is no move to play"""
+        statistics = self.search(game, playouts, time_limit, stop_event)
+        if not statistics:
+            return None
+        src_square, dest_square, _, _ = statistics[0]
+        return src_square, dest_square
+
+    def search(self, game, playouts=None, time_limit=None, stop_event=None):
+        """Searches a position and gets (source, destination, visits, score) for each root move, most visited first.
+
+        The search ends when the playouts or the time limit run out, or once stop_event (a threading.Event) is set.
+        Setting stop_event ends the search after the batch of rollouts in progress.
+        """
+        if playouts is None and time_limit is None and stop_event is None:
+            raise ValueError("Search needs a playout budget, a time limit or a stop event.")
+
+        root_snapshot = game.get_snapshot()
+        scratch = ChessVar(verbose=False)
+        tree = SearchTree()
+        self._tree = tree
+        tree.expand(0, game.get_legal_moves())
+        if game.get_game_state() != 'UNFINISHED' or not tree.child_count[0]:
+            return []
+
+        deadline = time.monotonic() + time_limit if time_limit is not None else None
+        done = 0
+        while ((playouts is None or done < playouts) and (deadline is None or time.monotonic() < deadline)
+               and not (stop_event is not None and stop_event.is_set())):
+            size = self._batch_size if playouts is None else min(self._batch_size, playouts - done)
+            leaves = [self._select(tree, scratch, root_snapshot) for _ in range(size)]
+
+            # Leaves that ended the game already carry their score and skip the rollout
+            tasks = [(snapshot, self._rollout_plies, self._rng.getrandbits(32))
+                     for _, snapshot, score in leaves if score is None]
+            results = iter(self._run_rollouts(tasks))
+            for path, _, score in leaves:
+                self._backpropagate(tree, path, next(results) if score is None else score, game.get_player_turn())
+            done += size
+
+        statistics = []
+        for child in tree.children(0):
+            src_square, dest_square = tree.move(child)
+            visits = tree.visits[child]
+            statistics.append((src_square, dest_square, visits, tree.score[child] / visits if visits else 0.0))
+        statistics.sort(key=lambda entry: (entry[2], entry[3]), reverse=True)
+        return statistics
+
+    def get_playout_count(self):
+        """Gets number of playouts made by the latest search"""
+        return self._tree.visits[0] if self._tree is not None else 0
+
+    def get_principal_variation(self, max_length=8):
+        """Gets the most visited line of the latest search as (source, destination) moves"""
+        line = []
+        node = 0
+        while self._tree is not None and len(line) < max_length:
+            children = self._tree.children(node)
+            if not children:
+                break
+            node = max(children, key=lambda child: self._tree.visits[child])
+            if not self._tree.visits[node]:
+                break
+            line.append(self._tree.move(node))
+        return line
+
+    def _select(self, tree, scratch, root_snapshot):
+        """Walks down the tree to a leaf. Gets (path, leaf snapshot, known score or None)"""
+        scratch.restore_snapshot(root_snapshot)
+        node = 0
+        path = [0]
+        # Count the visit right away, a virtual loss that spreads one batch over different leaves
+        tree.visits[0] += 1
+
+        while True:
+            game_state = scratch.get_game_state()
+            if game_state != 'UNFINISHED':
+                return path, None, RESULT_SCORES.get(game_state, 0.5)
+
+            if tree.first_child[node] < 0:
+                moves = scratch.get_legal_moves()
+                if not moves:
+                    return path, None, 0.5
+                tree.expand(node, moves)
+
+            node = self._best_child(tree, node)
+            scratch.make_move(*tree.move(node))
+            path.append(node)
+            tree.visits[node] += 1
+            if tree.visits[node] == 1:
+                game_state = scratch.get_game_state()
+                if game_state != 'UNFINISHED':
+                    return path, None, RESULT_SCORES.get(game_state, 0.5)
+                return path, scratch.get_snapshot(), None
+
+    def _best_child(self, tree, node):
+        """Picks the child with the highest UCT value, trying unvisited children first"""
+        log_visits = math.log(max(tree.visits[node], 1))
+        best_child, best_value = -1, -1.0
+        for child in tree.children(node):
+            visits = tree.visits[child]
+            if visits == 0:
+                return child
+            value = tree.score[child] / visits + self._exploration * math.sqrt(log_visits / visits)
+            if value > best_value:
+                best_child, best_value = child, value
+        return best_child
+
+    def _backpropagate(self, tree, path, white_score, root_turn):
+        """Adds a rollout score along a path, from the view of each node's mover"""
+        # Children of the root were played by the player to move at the root, then the movers alternate
+        white_moved = root_turn == 'WHITE'
+        for node in path[1:]:
+            tree.score[node] += white_score if white_moved else 1.0 - white_score
+            white_moved = not white_moved
+
+    def _run_rollouts(self, tasks):
+        """Runs rollouts inline or spread over the process pool"""
+        if not tasks:
+            return []
+        if self._workers == 1:
+            return [rollout(*task) for task in tasks]
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self._workers)
+        chunk = max(1, len(tasks) // self._workers)
+        batches = [tasks[start:start + chunk] for start in range(0, len(tasks), chunk)]
+        return [score for batch in self._executor.map(_rollout_batch, batches) for score in batch]
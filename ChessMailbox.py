@@ -0,0 +1,210 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Array-based rules backend for atomic chess, a candidate replacement for the dict board
+
+COLUMNS = 'abcdefgh'
+SQUARES = [f"{col}{row}" for row in range(1, 9) for col in COLUMNS]
+SQUARE_INDEX = {square: index for index, square in enumerate(SQUARES)}
+
+# A game is drawn after this many plies without a capture or a pawn move
+FIFTY_MOVE_PLIES = 100
+
+
+def _targets(index, offsets):
+    """Lists the squares reached from a square by each (column, row) offset that stays on the board"""
+    col, row = index % 8, index // 8
+    return tuple((row + row_step) * 8 + col + col_step for col_step, row_step in offsets
+                 if 0 <= col + col_step < 8 and 0 <= row + row_step < 8)
+
+
+def _rays(index, directions):
+    """Lists, for each direction, the squares a sliding piece passes from a square"""
+    col, row = index % 8, index // 8
+    rays = []
+    for col_step, row_step in directions:
+        ray = []
+        ray_col, ray_row = col + col_step, row + row_step
+        while 0 <= ray_col < 8 and 0 <= ray_row < 8:
+            ray.append(ray_row * 8 + ray_col)
+            ray_col += col_step
+            ray_row += row_step
+        rays.append(tuple(ray))
+    return tuple(rays)
+
+
+KING_STEPS = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+KNIGHT_STEPS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+ROOK_STEPS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+BISHOP_STEPS = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+
+# Move tables, indexed by square
+NEIGHBOURS = tuple(_targets(index, KING_STEPS) for index in range(64))
+KNIGHT_TARGETS = tuple(_targets(index, KNIGHT_STEPS) for index in range(64))
+SLIDER_RAYS = {
+    'R': tuple(_rays(index, ROOK_STEPS) for index in range(64)),
+    'B': tuple(_rays(index, BISHOP_STEPS) for index in range(64)),
+    'Q': tuple(_rays(index, ROOK_STEPS + BISHOP_STEPS) for index in range(64)),
+}
+
+START_POSITION = {
+    'a1': 'WR', 'b1': 'WN', 'c1': 'WB', 'd1': 'WQ', 'e1': 'WK', 'f1': 'WB', 'g1': 'WN', 'h1': 'WR',
+    'a8': 'BR', 'b8': 'BN', 'c8': 'BB', 'd8': 'BQ', 'e8': 'BK', 'f8': 'BB', 'g8': 'BN', 'h8': 'BR',
+}
+START_POSITION.update({f"{col}2": 'WP' for col in COLUMNS})
+START_POSITION.update({f"{col}7": 'BP' for col in COLUMNS})
+
+
+# MAILBOX BOARD CLASS
+class MailboxBoard:
+    """Plays atomic chess on a flat list of 64 piece codes, following the same rules as ChessVar"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Sets up the starting position"""
+        # Piece code or None per square, a1 first and h8 last
+        self._squares = [START_POSITION.get(square) for square in SQUARES]
+        # True where a pawn stands that has already moved
+        self._pawn_moved = [False] * 64
+        self._player_turn = 'WHITE'
+        self._halfmove_clock = 0
+        self._repetitions = {self._position_key(): 1}
+
+    def restore_snapshot(self, snapshot):
+        """Sets up the position of a ChessVar snapshot. Restarts the draw counters"""
+        player_turn, pieces = snapshot
+        self._squares = [None] * 64
+        self._pawn_moved = [False] * 64
+        for square, code, has_moved in pieces:
+            index = SQUARE_INDEX[square]
+            self._squares[index] = code
+            self._pawn_moved[index] = has_moved
+        self._player_turn = player_turn
+        self._halfmove_clock = 0
+        self._repetitions = {self._position_key(): 1}
+
+    def copy(self):
+        """Gets an independent copy of the board, cheaper than a snapshot round trip"""
+        board = MailboxBoard.__new__(MailboxBoard)
+        board._squares = self._squares[:]
+        board._pawn_moved = self._pawn_moved[:]
+        board._player_turn = self._player_turn
+        board._halfmove_clock = self._halfmove_clock
+        board._repetitions = dict(self._repetitions)
+        return board
+
+    def get_snapshot(self):
+        """Gets the position in the ChessVar snapshot format, squares in board order"""
+        return self._player_turn, tuple((SQUARES[index], code, self._pawn_moved[index])
+                                        for index, code in enumerate(self._squares) if code)
+
+    def get_player_turn(self):
+        """Gets player turn"""
+        return self._player_turn
+
+    def get_legal_moves(self):
+        """Gets (source, destination) pairs the current player is allowed to play"""
+        color = self._player_turn[0]
+        squares = self._squares
+        return [(SQUARES[index], SQUARES[dest]) for index, code in enumerate(squares)
+                if code and code[0] == color for dest in self._destinations(index)]
+
+    def get_game_state(self):
+        """Gets game state. Returns winner, DRAW or if game is unfinished"""
+        squares = self._squares
+        if 'WK' not in squares:
+            return 'BLACK_WON'
+        if 'BK' not in squares:
+            return 'WHITE_WON'
+        if sum(1 for code in squares if code) == 2:
+            return 'DRAW'
+        if self._halfmove_clock >= FIFTY_MOVE_PLIES or self._repetitions.get(self._position_key(), 0) >= 3:
+            return 'DRAW'
+        return 'UNFINISHED'
+
+    def make_move(self, src_square, dest_square):
+        """Makes a move. Captures need no verification, like in ChessVar; quiet moves must be legal"""
+        src = SQUARE_INDEX.get(src_square.lower())
+        dest = SQUARE_INDEX.get(dest_square.lower())
+        if src is None or dest is None:
+            return False
+        squares = self._squares
+        code = squares[src]
+        if not code or code[0] != self._player_turn[0]:
+            return False
+        dest_code = squares[dest]
+        if dest_code and dest_code[0] == code[0]:
+            return False
+
+        if dest_code:
+            self._capture(src, dest)
+        else:
+            if dest not in self._destinations(src):
+                return False
+            squares[dest] = code
+            squares[src] = None
+            self._pawn_moved[dest] = code[1] == 'P'
+            self._pawn_moved[src] = False
+        self._player_turn = 'BLACK' if self._player_turn == 'WHITE' else 'WHITE'
+
+        if dest_code or code[1] == 'P':
+            self._halfmove_clock = 0
+            self._repetitions = {}
+        else:
+            self._halfmove_clock += 1
+        key = self._position_key()
+        self._repetitions[key] = self._repetitions.get(key, 0) + 1
+        return True
+
+    def _capture(self, src, dest):
+        """Removes the captured piece, the captor and, while both Kings stand, non-pawn pieces next to it"""
+        squares = self._squares
+        squares[dest] = None
+        squares[src] = None
+        self._pawn_moved[src] = False
+        self._pawn_moved[dest] = False
+        if 'WK' in squares and 'BK' in squares:
+            for square in NEIGHBOURS[dest]:
+                if squares[square] and squares[square][1] != 'P':
+                    squares[square] = None
+
+    def _destinations(self, index):
+        """Lists the squares the piece on a square may move to"""
+        squares = self._squares
+        code = squares[index]
+        color, kind = code
+        destinations = []
+
+        if kind == 'P':
+            step = 8 if color == 'W' else -8
+            forward = index + step
+            if 0 <= forward < 64:
+                if squares[forward] is None:
+                    destinations.append(forward)
+                    double = forward + step
+                    if not self._pawn_moved[index] and 0 <= double < 64 and squares[double] is None:
+                        destinations.append(double)
+                for dest in NEIGHBOURS[index]:
+                    if dest // 8 == forward // 8 and dest != forward and squares[dest] and squares[dest][0] != color:
+                        destinations.append(dest)
+        elif kind == 'N':
+            destinations.extend(dest for dest in KNIGHT_TARGETS[index]
+                                if not squares[dest] or squares[dest][0] != color)
+        elif kind == 'K':
+            # Kings never capture
+            destinations.extend(dest for dest in NEIGHBOURS[index] if not squares[dest])
+        else:
+            for ray in SLIDER_RAYS[kind][index]:
+                for dest in ray:
+                    if squares[dest]:
+                        if squares[dest][0] != color:
+                            destinations.append(dest)
+                        break
+                    destinations.append(dest)
+        return destinations
+
+    def _position_key(self):
+        """Gets a key that is equal for equal positions"""
+        return self._player_turn, tuple(self._squares), tuple(self._pawn_moved)
@@ -0,0 +1,152 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Memory report of ChessVar games: bytes per game, usage by object type and peak RSS under load
+
+import argparse
+import gc
+import json
+import multiprocessing
+import platform
+import random
+import sys
+import tracemalloc
+import types
+from importlib import metadata
+
+from ChessVar import ChessVar
+
+DEFAULT_MOVES = 40
+DEFAULT_GAMES = 10000
+
+# Shared by every game, so they are not part of what one game costs
+SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def play_random_moves(game, moves, rng):
+    """Plays up to a number of random legal moves, stopping early if the game ends"""
+    for _ in range(moves):
+        if game.get_game_state() != 'UNFINISHED':
+            break
+        game.make_move(*rng.choice(game.get_legal_moves()))
+
+
+def measure_game(moves=DEFAULT_MOVES, seed=0):
+    """Gets (bytes at creation, bytes after the moves) that tracemalloc attributes to one game"""
+    rng = random.Random(seed)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        game = ChessVar(verbose=False)
+        created = tracemalloc.get_traced_memory()[0] - before
+        play_random_moves(game, moves, rng)
+        gc.collect()
+        played = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return created, played
+
+
+def type_breakdown(game):
+    """Gets {type name: (objects, bytes)} of every object reachable from a game, largest first.
+
+    Small interned strings and ints are shared between games but counted here, so the total is an upper bound.
+    """
+    seen = {id(game)}
+    pending = [game]
+    usage = {}
+    while pending:
+        obj = pending.pop()
+        name = type(obj).__name__
+        count, size = usage.get(name, (0, 0))
+        usage[name] = count + 1, size + sys.getsizeof(obj)
+        for referent in gc.get_referents(obj):
+            if id(referent) not in seen and not isinstance(referent, SHARED_TYPES):
+                seen.add(id(referent))
+                pending.append(referent)
+    return dict(sorted(usage.items(), key=lambda item: item[1][1], reverse=True))
+
+
+def load_test(games=DEFAULT_GAMES, moves=DEFAULT_MOVES, seed=0):
+    """Holds many games at once in a fresh process and gets {rss_before, rss_peak, bytes_per_game} in bytes"""
+    # A spawned process starts without the memory of this one, so its peak only covers the games
+    context = multiprocessing.get_context('spawn')
+    with context.Pool(1) as pool:
+        return pool.apply(_hold_games, (games, moves, seed))
+
+
+def _hold_games(games, moves, seed):
+    """Creates games, plays moves in each and measures peak RSS of this process"""
+    rss_before = _peak_rss()
+    rng = random.Random(seed)
+    held = []
+    for _ in range(games):
+        game = ChessVar(verbose=False)
+        play_random_moves(game, moves, rng)
+        held.append(game)
+    rss_peak = _peak_rss()
+    return {'rss_before': rss_before, 'rss_peak': rss_peak,
+            'bytes_per_game': (rss_peak - rss_before) // max(games, 1)}
+
+
+def _peak_rss():
+    """Gets the peak resident set size of this process in bytes"""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes and macOS bytes
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def memory_report(moves=DEFAULT_MOVES, games=DEFAULT_GAMES, seed=0):
+    """Gathers every measurement in one dictionary, ready to be saved and compared between releases"""
+    created, played = measure_game(moves, seed)
+    game = ChessVar(verbose=False)
+    play_random_moves(game, moves, random.Random(seed))
+    try:
+        version = metadata.version('atomic-chess')
+    except metadata.PackageNotFoundError:
+        version = None
+
+    report = {
+        'version': version,
+        'python': platform.python_version(),
+        'moves': moves,
+        'bytes_at_creation': created,
+        'bytes_after_moves': played,
+        'types': {name: {'objects': count, 'bytes': size} for name, (count, size) in type_breakdown(game).items()},
+    }
+    if games:
+        report['load_test'] = dict(load_test(games, moves, seed), games=games)
+    return report
+
+
+# MAIN
+def main():
+    parser = argparse.ArgumentParser(description="Report how much memory ChessVar games use.")
+    parser.add_argument('--moves', type=int, default=DEFAULT_MOVES, help="random moves played in each game")
+    parser.add_argument('--games', type=int, default=DEFAULT_GAMES, help="games held at once by the load test, 0 skips it")
+    parser.add_argument('--seed', type=int, default=0, help="random seed of the moves")
+    parser.add_argument('--json', action='store_true', help="print the report as JSON")
+    args = parser.parse_args()
+
+    report = memory_report(args.moves, args.games, args.seed)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"Bytes per game at creation:       {report['bytes_at_creation']:>10,}")
+    print(f"Bytes per game after {args.moves:>3} moves:   {report['bytes_after_moves']:>10,}")
+    print()
+    print(f"{'Type':<20}{'Objects':>10}{'Bytes':>12}")
+    for name, usage in report['types'].items():
+        print(f"{name:<20}{usage['objects']:>10,}{usage['bytes']:>12,}")
+    if 'load_test' in report:
+        load = report['load_test']
+        print()
+        print(f"Load test with {load['games']:,} games: peak RSS {load['rss_peak'] / 2 ** 20:,.1f} MiB, "
+              f"{load['bytes_per_game']:,} bytes per game, {2 ** 30 // max(load['bytes_per_game'], 1):,} games per GiB")
+
+
+if __name__ == '__main__':
+    main()
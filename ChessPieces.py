@@ -7,6 +7,7 @@
 # CHESS PIECE CLASSES
 class Piece:
     """Creates base Piece object that specific chess pieces inherit from"""
+
     def __init__(self, color):
         self._color = color
 
@@ -22,6 +23,7 @@ class Piece:
 
 class Pawn(Piece):
     "Creates a Pawn"
+
     def __init__(self, color):
         super().__init__(color)
         self._has_moved = False
@@ -39,6 +41,7 @@ class Pawn(Piece):
 
 class Rook(Piece):
     """Creates a Rook"""
+
     def __init__(self, color):
         super().__init__(color)
 
@@ -49,6 +52,7 @@ class Rook(Piece):
 
 class Knight(Piece):
     """Creates a Knight"""
+
     def __init__(self, color):
         super().__init__(color)
 
@@ -59,6 +63,7 @@ class Knight(Piece):
 
 class Bishop(Piece):
     """Creates a Bishop"""
+
     def __init__(self, color):
         super().__init__(color)
 
@@ -69,6 +74,7 @@ class Bishop(Piece):
 
 class Queen(Piece):
     """Creates a Queen"""
+
     def __init__(self, color):
         super().__init__(color)
 
@@ -79,6 +85,7 @@ class Queen(Piece):
 
 class King(Piece):
     """Creates a King"""
+
     def __init__(self, color):
         super().__init__(color)
 
@@ -87,6 +94,18 @@ class King(Piece):
         return 'WK' if self._color == 'WHITE' else 'BK'
 
 
+# Piece classes by the letter used in their string codes
+PIECE_CLASSES = {'P': Pawn, 'R': Rook, 'N': Knight, 'B': Bishop, 'Q': Queen, 'K': King}
+
+
+def make_piece(code, has_moved=False):
+    """Creates a piece from a string code such as 'WP'"""
+    piece = PIECE_CLASSES[code[1]]('WHITE' if code[0] == 'W' else 'BLACK')
+    if has_moved:
+        piece.set_has_moved()
+    return piece
+
+
 # VERIFICATION METHODS
 def verify_move(chess_piece, src_square, dest_square, board):
     """Verifies move of piece type"""
@@ -150,15 +169,16 @@ def verify_move(chess_piece, src_square, dest_square, board):
 
     # QUEEN VERIFICATION - Can move unlimited squares in all directions
     elif isinstance(chess_piece, Queen):
-        if (dest_row == src_row or dest_col == src_col or abs(dest_row - src_row) == abs(dest_col - src_col)) and is_path_clear(board, src_square, dest_square):
+        if (dest_row == src_row or dest_col == src_col or abs(dest_row - src_row) == abs(
+                dest_col - src_col)) and is_path_clear(board, src_square, dest_square):
             return True
         return False
 
     # KING VERIFICATION - Can move 1 square in all directions
     elif isinstance(chess_piece, King):
-        if abs(dest_row - src_row) <= 1 and abs(dest_col - src_col) <= 1:
-            return True
-        return False
+        if dest_square.lower() in board and isinstance(board[dest_square.lower()], Piece):
+            return False
+        return abs(dest_row - src_row) <= 1 and abs(dest_col - src_col) <= 1
 
     return False
 
@@ -206,9 +226,80 @@ def is_path_clear(board, src_square, dest_square):
     return True
 
 
+# Offsets used to list candidate destination squares for each piece type
+KNIGHT_OFFSETS = ((1, 2), (2, 1), (2, -1), (1, -2), (-1, -2), (-2, -1), (-2, 1), (-1, 2))
+KING_OFFSETS = ((0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1), (-1, 0), (-1, 1))
+ROOK_DIRECTIONS = ((0, 1), (1, 0), (0, -1), (-1, 0))
+BISHOP_DIRECTIONS = ((1, 1), (1, -1), (-1, -1), (-1, 1))
+
+
+def generate_moves(board, color):
+    """Generates every (source, destination) pair that verify_move allows for a player color"""
+    moves = []
+    for src_square, piece in board.items():
+        if piece.get_color() != color:
+            continue
+
+        for dest_square in candidate_squares(piece, src_square, board):
+            # Pieces can never land on a square held by their own side
+            dest_piece = board.get(dest_square)
+            if dest_piece and dest_piece.get_color() == color:
+                continue
+
+            # Candidates only narrow the search, verify_move still has the final say
+            if verify_move(piece, src_square, dest_square, board):
+                moves.append((src_square, dest_square))
+    return moves
+
+
+def candidate_squares(chess_piece, src_square, board):
+    """Lists the squares a piece could reach by its movement pattern, ignoring who occupies them"""
+    columns = 'abcdefgh'
+    src_col = columns.index(src_square[0])
+    src_row = int(src_square[1])
+
+    if isinstance(chess_piece, Pawn):
+        step = 1 if chess_piece.get_color() == 'WHITE' else -1
+        offsets = ((0, step), (0, 2 * step), (-1, step), (1, step))
+    elif isinstance(chess_piece, Knight):
+        offsets = KNIGHT_OFFSETS
+    elif isinstance(chess_piece, King):
+        offsets = KING_OFFSETS
+    else:
+        offsets = ()
+
+    squares = []
+    for col_step, row_step in offsets:
+        col, row = src_col + col_step, src_row + row_step
+        if 0 <= col < 8 and 1 <= row <= 8:
+            squares.append(f"{columns[col]}{row}")
+
+    # Sliding pieces walk each direction until the first occupied square
+    if isinstance(chess_piece, Queen):
+        directions = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+    elif isinstance(chess_piece, Rook):
+        directions = ROOK_DIRECTIONS
+    elif isinstance(chess_piece, Bishop):
+        directions = BISHOP_DIRECTIONS
+    else:
+        directions = ()
+
+    for col_step, row_step in directions:
+        col, row = src_col + col_step, src_row + row_step
+        while 0 <= col < 8 and 1 <= row <= 8:
+            square = f"{columns[col]}{row}"
+            squares.append(square)
+            if square in board:
+                break
+            col += col_step
+            row += row_step
+    return squares
+
+
 # EXCEPTION CLASSES
 class ExecutionError(Exception):
     """Raises an execution error"""
+
     def __init__(self, message="This method or function cannot be executed."):
         self.message = message
         super().__init__(self.message)
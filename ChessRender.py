@@ -0,0 +1,32 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 5/25/24
+# Description: Chessboard console rendering
+
+
+def print_board(board):
+    """Prints board to console"""
+
+    # Top Border and Label
+    pipe_sep = " | "
+    print("       " + "     ".join("abcdefgh"))
+    print("    " + "+" + "-----+" * 8)  # Prints 8 times for number of rows
+    for row in range(8, 0, -1):
+        # Prints row number first
+        print(row, ' ', end=pipe_sep)  # Override default 'end' for print() method
+
+        # Since columns are labeled letters, we need to use the ASCII values of the character labels
+        for col in range(97, 105):
+            column_pos = chr(col)  # col is converted to string character based on the ASCII ranges in the for loop
+
+            # For example, c(col) + 8(row) is retrieved from the board dictionary as 'c8'
+            # Get chess piece from dictionary board
+            piece = board.get(f"{column_pos}{row}")
+
+            # If there is a piece in the position it gets __str__ of Piece, else it is an empty space
+            piece_str = str(piece) if piece else ' '
+            print("{:^3}".format(piece_str), end=pipe_sep)
+        print("  ", row)
+        print("    " + "+" + "-----+" * 8)
+    # Bottom Label
+    print("       " + "     ".join("abcdefgh"))
@@ -0,0 +1,234 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: SQLite persistence for live games with batched writes and lazy loading
+
+import logging
+import sqlite3
+import threading
+import time
+
+from ChessVar import ChessVar, is_irreversible
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    game_id TEXT PRIMARY KEY,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS moves (
+    game_id TEXT NOT NULL,
+    ply INTEGER NOT NULL,
+    src TEXT NOT NULL,
+    dest TEXT NOT NULL,
+    irreversible INTEGER NOT NULL,
+    PRIMARY KEY (game_id, ply)
+);
+CREATE TABLE IF NOT EXISTS snapshots (
+    game_id TEXT NOT NULL,
+    ply INTEGER NOT NULL,
+    position TEXT NOT NULL,
+    PRIMARY KEY (game_id, ply)
+);
+"""
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL = 0.25
+DEFAULT_SNAPSHOT_INTERVAL = 32
+
+
+# SNAPSHOT ENCODING
+def encode_snapshot(snapshot):
+    """Writes a ChessVar snapshot as text such as 'WHITE;a1WR0,a2WP0,...'"""
+    player_turn, pieces = snapshot
+    return player_turn + ';' + ','.join(f"{square}{code}{int(has_moved)}" for square, code, has_moved in pieces)
+
+
+def decode_snapshot(text):
+    """Reads text written by encode_snapshot back into a ChessVar snapshot"""
+    player_turn, pieces = text.split(';')
+    return player_turn, tuple((item[:2], item[2:4], item[4] == '1') for item in pieces.split(',') if item)
+
+
+# GAME STORE CLASS
+class GameStore:
+    """Appends moves of tracked games to SQLite, grouping the writes of all games into one transaction per interval"""
+
+    def __init__(self, path, flush_interval=DEFAULT_FLUSH_INTERVAL, snapshot_interval=DEFAULT_SNAPSHOT_INTERVAL):
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # WAL keeps the database consistent with NORMAL; only the last interval can be lost on power failure
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+        self._database_lock = threading.Lock()
+
+        self._flush_interval = flush_interval
+        self._snapshot_interval = snapshot_interval
+
+        # Statements waiting for the next transaction
+        self._pending = []
+        self._pending_lock = threading.Condition()
+
+        # Loaded games, the ply their ChessVar history starts at, and the last ply written for them
+        self._games = {}
+        # Held while a game is created or loaded, so each id only ever gets one ChessVar
+        self._games_lock = threading.Lock()
+        self._base_plies = {}
+        self._stored_plies = {}
+
+        self._closed = False
+        self._writer = threading.Thread(target=self._write_loop, daemon=True)
+        self._writer.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def create_game(self, game_id, verbose=False):
+        """Creates, stores and tracks a new game"""
+        game_id = str(game_id)
+        with self._games_lock:
+            # Games created since the last flush are all loaded, so the database is only asked about older ones
+            if game_id in self._games or self._is_stored(game_id):
+                raise ValueError(f"Game {game_id} already exists.")
+            game = ChessVar(verbose=verbose)
+            self._track(game_id, game)
+        return game
+
+    def track(self, game_id, game):
+        """Starts storing every move of a game from its current position on"""
+        with self._games_lock:
+            self._track(str(game_id), game)
+
+    def get_game(self, game_id):
+        """Gets a game, loading it from the database the first time it is asked for"""
+        game_id = str(game_id)
+        game = self._games.get(game_id)
+        if game is None:
+            with self._games_lock:
+                if game_id not in self._games:
+                    self._load(game_id)
+                game = self._games[game_id]
+        return game
+
+    def get_game_ids(self):
+        """Gets ids of every stored game without loading any of them"""
+        self.flush()
+        with self._database_lock:
+            return [row[0] for row in self._connection.execute("SELECT game_id FROM games ORDER BY created")]
+
+    def flush(self):
+        """Writes every pending move now"""
+        # Batches are taken and committed under one lock, so they reach the database in the order queued
+        with self._database_lock:
+            with self._pending_lock:
+                pending, self._pending = self._pending, []
+            self._write(pending)
+
+    def close(self):
+        """Writes pending moves and closes the database"""
+        if self._closed:
+            return
+        self._closed = True
+        with self._pending_lock:
+            self._pending_lock.notify()
+        self._writer.join()
+        self.flush()
+        self._connection.close()
+
+    def _track(self, game_id, game):
+        """Tracks a game, the caller holds the games lock"""
+        self._games[game_id] = game
+        self._base_plies[game_id] = -game.get_ply()
+        self._stored_plies[game_id] = 0
+        self._queue("INSERT OR IGNORE INTO games (game_id, created) VALUES (?, ?)", (game_id, time.time()))
+        self._queue("DELETE FROM moves WHERE game_id = ?", (game_id,))
+        self._queue("DELETE FROM snapshots WHERE game_id = ?", (game_id,))
+        self._queue("INSERT INTO snapshots (game_id, ply, position) VALUES (?, 0, ?)",
+                    (game_id, encode_snapshot(game.get_snapshot())))
+        game.subscribe(lambda diff: self._on_move(game_id, game))
+
+    def _on_move(self, game_id, game):
+        """Queues the move just made, and a snapshot when one is due"""
+        if self._games.get(game_id) is not game:
+            return
+        record = game.get_move_record(game.get_ply())
+        ply = self._base_plies[game_id] + game.get_ply()
+
+        # A move made after seeking back replaces the stored moves that followed
+        if ply <= self._stored_plies[game_id]:
+            self._queue("DELETE FROM moves WHERE game_id = ? AND ply >= ?", (game_id, ply))
+            self._queue("DELETE FROM snapshots WHERE game_id = ? AND ply >= ?", (game_id, ply))
+        self._stored_plies[game_id] = ply
+
+        self._queue("INSERT INTO moves (game_id, ply, src, dest, irreversible) VALUES (?, ?, ?, ?, ?)",
+                    (game_id, ply, record.get_source(), record.get_destination(), int(is_irreversible(record))))
+        if ply % self._snapshot_interval == 0:
+            self._queue("INSERT OR REPLACE INTO snapshots (game_id, ply, position) VALUES (?, ?, ?)",
+                        (game_id, ply, encode_snapshot(game.get_snapshot())))
+
+    def _is_stored(self, game_id):
+        """Checks if a game is in the database, without writing pending moves first"""
+        with self._database_lock:
+            return self._connection.execute("SELECT 1 FROM games WHERE game_id = ?", (game_id,)).fetchone() is not None
+
+    def _load(self, game_id):
+        """Rebuilds a game from a snapshot and the moves stored after it, the caller holds the games lock"""
+        self.flush()
+        with self._database_lock:
+            # The draw counters restart at every capture or pawn move. Replaying from the last snapshot
+            # at or before the latest such move rebuilds them exactly as the live game had them
+            last_irreversible = self._connection.execute(
+                "SELECT COALESCE(MAX(ply), 0) FROM moves WHERE game_id = ? AND irreversible",
+                (game_id,)).fetchone()[0]
+            row = self._connection.execute(
+                "SELECT ply, position FROM snapshots WHERE game_id = ? AND ply <= ? ORDER BY ply DESC LIMIT 1",
+                (game_id, last_irreversible)).fetchone()
+            if row is None:
+                raise ValueError(f"Game {game_id} does not exist.")
+            snapshot_ply, position = row
+            moves = self._connection.execute(
+                "SELECT ply, src, dest FROM moves WHERE game_id = ? AND ply > ? ORDER BY ply",
+                (game_id, snapshot_ply)).fetchall()
+
+        # The history of a loaded game starts at the snapshot
+        game = ChessVar(verbose=False)
+        game.restore_snapshot(decode_snapshot(position))
+        for _, src_square, dest_square in moves:
+            game.make_move(src_square, dest_square)
+
+        self._games[game_id] = game
+        self._base_plies[game_id] = snapshot_ply
+        self._stored_plies[game_id] = moves[-1][0] if moves else snapshot_ply
+        game.subscribe(lambda diff: self._on_move(game_id, game))
+
+    def _queue(self, statement, parameters):
+        """Adds a statement to the next transaction"""
+        with self._pending_lock:
+            self._pending.append((statement, parameters))
+
+    def _write_loop(self):
+        """Runs on the writer thread and commits pending statements once per interval"""
+        while not self._closed:
+            with self._pending_lock:
+                self._pending_lock.wait(self._flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                # A failed batch is rolled back and dropped, the writer carries on with the next one
+                logger.exception("Could not write a batch of game moves.")
+
+    def _write(self, pending):
+        """Commits statements in a single transaction, the caller holds the database lock"""
+        if not pending:
+            return
+        self._connection.execute("BEGIN")
+        try:
+            for statement, parameters in pending:
+                self._connection.execute(statement, parameters)
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
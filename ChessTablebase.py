@@ -0,0 +1,571 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Atomic endgame tablebase generator and probe
+
+import argparse
+import mmap
+import os
+from array import array
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from math import comb
+
+from ChessPieces import King, Queen, Rook, Bishop, Knight, ExecutionError, generate_moves
+from ChessVar import ChessVar
+
+
+# TABLE LAYOUT
+# Every file starts with a 16 byte header: a magic tag followed by the material name.
+# The body holds one signed byte per position, seen from the player to move:
+#   n > 0  the player to move wins in n plies
+#   n < 0  the player to move loses in -n plies
+#   0      draw (also used for slots that do not describe a position)
+# Positions are stored once per symmetry class: the board is turned or mirrored until the white King stands
+# in the a1-d1-d4 triangle, and identical pieces share one index digit holding their set of squares.
+# Tables of up to four pieces are supported, five pieces would need hundreds of millions of positions.
+MAGIC = b'ATB2'
+HEADER_SIZE = 16
+FILE_EXTENSION = '.atb'
+
+# Pawns are left out since their moved-state would have to be part of the index
+PIECE_ORDER = 'KQRBN'
+PIECE_CLASSES = {'K': King, 'Q': Queen, 'R': Rook, 'B': Bishop, 'N': Knight}
+COLUMNS = 'abcdefgh'
+SQUARES = [f"{col}{row}" for row in range(1, 9) for col in COLUMNS]
+SQUARE_INDEX = {square: index for index, square in enumerate(SQUARES)}
+TURNS = ('WHITE', 'BLACK')
+
+# Marks positions whose player to move has no capturing moves
+NO_CAPTURES = -128
+MAX_DISTANCE = 127
+MAX_PIECES = 4
+
+
+def _transform(col_map, row_map, swap):
+    """Gets the square each square goes to under one symmetry of the board"""
+    squares = []
+    for square in range(64):
+        col, row = col_map(square % 8), row_map(square // 8)
+        if swap:
+            col, row = row, col
+        squares.append(row * 8 + col)
+    return tuple(squares)
+
+
+# Pawnless positions keep their value when the board is turned or mirrored, in any of these 8 ways
+TRANSFORMS = tuple(_transform(col_map, row_map, swap)
+                   for col_map in (lambda col: col, lambda col: 7 - col)
+                   for row_map in (lambda row: row, lambda row: 7 - row)
+                   for swap in (False, True))
+
+# King squares of the stored positions: the white King in the a1-d1-d4 triangle and, while it stands on the
+# diagonal, the black King on or below it
+KING_PAIRS = tuple((white_king, black_king)
+                   for white_king in range(64)
+                   if white_king % 8 < 4 and white_king // 8 <= white_king % 8
+                   for black_king in range(64)
+                   if black_king != white_king
+                   and (white_king // 8 != white_king % 8 or black_king // 8 <= black_king % 8))
+KING_PAIR_INDEX = {pair: index for index, pair in enumerate(KING_PAIRS)}
+
+# BINOMIALS[n][k] is the number of ways to pick k of n squares
+BINOMIALS = tuple(tuple(comb(n, k) for k in range(MAX_PIECES + 1)) for n in range(65))
+
+
+# MATERIAL HELPERS
+def parse_material(name):
+    """Splits a material name such as 'KQvK' into its white and black piece letters"""
+    sides = name.upper().split('V')
+    if len(sides) != 2:
+        raise ValueError(f"Material '{name}' must look like 'KQvK'.")
+
+    pieces = []
+    for side in sides:
+        if side.count('K') != 1 or any(letter not in PIECE_ORDER for letter in side):
+            raise ValueError(f"Material '{name}' needs exactly one King per side and no Pawns.")
+        pieces.append(tuple(sorted(side, key=PIECE_ORDER.index)))
+    return pieces[0], pieces[1]
+
+
+def material_name(white_pieces, black_pieces):
+    """Builds the canonical material name for two collections of piece letters"""
+    white = ''.join(sorted(white_pieces, key=PIECE_ORDER.index))
+    black = ''.join(sorted(black_pieces, key=PIECE_ORDER.index))
+    return f"{white}v{black}"
+
+
+def material_key(board):
+    """Gets the material name of a board, or None if no table could cover it"""
+    white_pieces = []
+    black_pieces = []
+    for piece in board.values():
+        letter = str(piece)[1]
+        if letter not in PIECE_CLASSES:
+            return None
+        if piece.get_color() == 'WHITE':
+            white_pieces.append(letter)
+        else:
+            black_pieces.append(letter)
+
+    if white_pieces.count('K') != 1 or black_pieces.count('K') != 1:
+        return None
+    return material_name(white_pieces, black_pieces)
+
+
+def sub_materials(name):
+    """Lists every smaller material (both Kings kept) that a capture from this material can lead to"""
+    white_pieces, black_pieces = parse_material(name)
+    white_extras = white_pieces[1:]
+    black_extras = black_pieces[1:]
+
+    names = set()
+    for white_mask in range(1 << len(white_extras)):
+        for black_mask in range(1 << len(black_extras)):
+            white = ['K'] + [letter for bit, letter in enumerate(white_extras) if white_mask >> bit & 1]
+            black = ['K'] + [letter for bit, letter in enumerate(black_extras) if black_mask >> bit & 1]
+            names.add(material_name(white, black))
+    names.discard(material_name(white_pieces, black_pieces))
+
+    # Smaller tables first so that each one can lean on the ones before it
+    return sorted(names, key=len)
+
+
+def table_groups(name):
+    """Gets the ((color, letter), count) group each index digit after the Kings stands for"""
+    white_pieces, black_pieces = parse_material(name)
+    groups = []
+    for color, pieces in (('WHITE', white_pieces[1:]), ('BLACK', black_pieces[1:])):
+        for letter in sorted(set(pieces), key=PIECE_ORDER.index):
+            groups.append(((color, letter), pieces.count(letter)))
+    return groups
+
+
+def table_size(groups):
+    """Gets the number of index slots of a table"""
+    size = 2 * len(KING_PAIRS)
+    for _, count in groups:
+        size *= BINOMIALS[64][count]
+    return size
+
+
+# INDEXING
+def combination_rank(squares):
+    """Numbers a set of squares, given in ascending order, from 0 up to the count of such sets"""
+    return sum(BINOMIALS[square][position + 1] for position, square in enumerate(squares))
+
+
+def combination_squares(rank, count):
+    """Gets the ascending squares of the set numbered rank by combination_rank"""
+    squares = []
+    for position in range(count, 0, -1):
+        square = 63
+        while BINOMIALS[square][position] > rank:
+            square -= 1
+        rank -= BINOMIALS[square][position]
+        squares.append(square)
+    return squares[::-1]
+
+
+def board_index(board, player_turn, groups):
+    """Computes the canonical table index of a board holding exactly the material of the groups"""
+    squares_by_slot = defaultdict(list)
+    for square, piece in board.items():
+        squares_by_slot[(piece.get_color(), str(piece)[1])].append(SQUARE_INDEX[square])
+    white_king = squares_by_slot[('WHITE', 'K')][0]
+    black_king = squares_by_slot[('BLACK', 'K')][0]
+
+    # Symmetric Kings leave more than one candidate, the smallest index stands for all of them
+    best = None
+    for transform in TRANSFORMS:
+        index = KING_PAIR_INDEX.get((transform[white_king], transform[black_king]))
+        if index is None:
+            continue
+        for slot, count in groups:
+            squares = sorted(transform[square] for square in squares_by_slot[slot])
+            index = index * BINOMIALS[64][count] + combination_rank(squares)
+        if best is None or index < best:
+            best = index
+
+    if player_turn == 'BLACK':
+        best += table_size(groups) // 2
+    return best
+
+
+def index_board(index, groups):
+    """Decodes a table index into (board, player_turn), or None if the index is not canonical"""
+    turn, rest = divmod(index, table_size(groups) // 2)
+
+    pieces = []
+    for slot, count in reversed(groups):
+        rest, rank = divmod(rest, BINOMIALS[64][count])
+        pieces.extend((slot, square) for square in combination_squares(rank, count))
+    white_king, black_king = KING_PAIRS[rest]
+    pieces.extend(((('WHITE', 'K'), white_king), (('BLACK', 'K'), black_king)))
+
+    board = {}
+    for (color, letter), square in pieces:
+        # Two pieces on one square
+        if SQUARES[square] in board:
+            return None
+        board[SQUARES[square]] = PIECE_CLASSES[letter](color)
+
+    # Another index of the same symmetry class is the one stored
+    if board_index(board, TURNS[turn], groups) != index:
+        return None
+    return board, TURNS[turn]
+
+
+def other_turn(player_turn):
+    """Gets the opposing player color"""
+    return 'BLACK' if player_turn == 'WHITE' else 'WHITE'
+
+
+def step_back(value):
+    """Converts the value of a position into the value of the move that leads to it"""
+    if value > 0:
+        return -(value + 1)
+    if value < 0:
+        return -value + 1
+    return 0
+
+
+# PROBING
+class Tablebase:
+    """Probes tablebase files through memory maps, opening each file on first use"""
+
+    def __init__(self, directory):
+        self._directory = directory
+        self._tables = {}
+
+    def probe(self, game):
+        """Gets ('WIN' | 'DRAW' | 'LOSS', plies) for the player to move, or None if no table covers the game"""
+        value = self.probe_value(game.get_board(), game.get_player_turn())
+        if value is None:
+            return None
+        if value > 0:
+            return 'WIN', value
+        if value < 0:
+            return 'LOSS', -value
+        return 'DRAW', 0
+
+    def probe_value(self, board, player_turn):
+        """Gets the signed table value of a board, or None if no table covers it"""
+        name = material_key(board)
+        if name is None:
+            return None
+
+        table = self._open(name)
+        if table is None:
+            return None
+
+        table_map, groups = table
+        raw = table_map[HEADER_SIZE + board_index(board, player_turn, groups)]
+        return raw - 256 if raw > MAX_DISTANCE else raw
+
+    def has_table(self, name):
+        """Checks if a table file exists for a material"""
+        return self._open(material_name(*parse_material(name))) is not None
+
+    def close(self):
+        """Closes every memory map"""
+        for table in self._tables.values():
+            if table is not None:
+                table[0].close()
+        self._tables = {}
+
+    def _open(self, name):
+        """Memory-maps a table file once and caches the map"""
+        if name not in self._tables:
+            path = os.path.join(self._directory, name + FILE_EXTENSION)
+            if not os.path.exists(path):
+                # Missing tables are looked up again next time, they may be generated meanwhile
+                return None
+
+            with open(path, 'rb') as table_file:
+                table_map = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+            if table_map[:len(MAGIC)] != MAGIC:
+                table_map.close()
+                raise ValueError(f"{path} is not a tablebase file.")
+            self._tables[name] = (table_map, table_groups(name))
+        return self._tables[name]
+
+
+# GENERATION
+# Worker processes keep their own probe and scratch game between chunks
+_worker_tablebase = None
+_worker_game = None
+
+
+def _scan_chunk(name, directory, start, stop):
+    """Counts the positions reached by quiet moves and scores capturing moves for a range of table indexes"""
+    global _worker_tablebase, _worker_game
+    if _worker_tablebase is None:
+        _worker_tablebase = Tablebase(directory)
+        _worker_game = ChessVar(verbose=False)
+
+    groups = table_groups(name)
+    quiet_counts = bytearray(stop - start)
+    capture_values = array('b', [NO_CAPTURES]) * (stop - start)
+    valid = bytearray(stop - start)
+
+    for offset, index in enumerate(range(start, stop)):
+        position = index_board(index, groups)
+        if position is None:
+            continue
+        board, player_turn = position
+        valid[offset] = 1
+
+        # Two quiet moves into one symmetry class count once, as the retrograde pass only sees classes
+        children = set()
+        best = NO_CAPTURES
+        for src_square, dest_square in generate_moves(board, player_turn):
+            if dest_square not in board:
+                child_board = dict(board)
+                child_board[dest_square] = child_board.pop(src_square)
+                children.add(board_index(child_board, other_turn(player_turn), groups))
+                continue
+
+            # Captures always shrink the material, so the outcome lives in a terminal state or a smaller table
+            _worker_game.set_position(dict(board), player_turn)
+            _worker_game.make_move(src_square, dest_square)
+            game_state = _worker_game.get_game_state()
+            if game_state in ('WHITE_WON', 'BLACK_WON'):
+                move_value = 1 if game_state == f"{player_turn}_WON" else -1
+            else:
+                child_value = _worker_tablebase.probe_value(_worker_game.get_board(), other_turn(player_turn))
+                if child_value is None:
+                    raise ExecutionError(f"Table for {material_key(_worker_game.get_board())} is missing.")
+                move_value = step_back(child_value)
+
+            if best == NO_CAPTURES or move_value_rank(move_value) > move_value_rank(best):
+                best = move_value
+        capture_values[offset] = best
+        quiet_counts[offset] = len(children)
+
+    return start, bytes(quiet_counts), capture_values.tobytes(), bytes(valid)
+
+
+def move_value_rank(value):
+    """Orders move values from the mover's view: short wins, long wins, draws, long losses, short losses"""
+    if value > 0:
+        return 2 * MAX_DISTANCE - value
+    if value < 0:
+        return -MAX_DISTANCE - value
+    return 0
+
+
+def _predecessors(index, groups):
+    """Lists, once each, the indexes of positions that reach this one by a quiet move"""
+    board, player_turn = index_board(index, groups)
+    mover = other_turn(player_turn)
+
+    # Quiet moves of these pieces are reversible, so un-moving is moving
+    indexes = {}
+    for src_square, dest_square in generate_moves(board, mover):
+        if dest_square in board:
+            continue
+        previous_board = dict(board)
+        previous_board[dest_square] = previous_board.pop(src_square)
+        indexes[board_index(previous_board, mover, groups)] = None
+    return list(indexes)
+
+
+def _predecessor_chunk(name, indexes):
+    """Runs _predecessors over a list of indexes in a worker process"""
+    groups = table_groups(name)
+    return [_predecessors(index, groups) for index in indexes]
+
+
+def _take_unresolved(indexes, resolved):
+    """Marks the unresolved indexes of a list as resolved and gets them, once each"""
+    taken = []
+    for index in indexes:
+        if not resolved[index]:
+            resolved[index] = 1
+            taken.append(index)
+    return taken
+
+
+def _retrograde(name, valid, quiet_counts, capture_values, expand):
+    """Gets the value of every position from the forward pass, following quiet moves backwards.
+
+    expand gets, for a list of indexes, the lists of indexes of positions reaching each of them by a quiet move.
+    quiet_counts is used up along the way.
+    """
+    size = len(valid)
+
+    # Seed positions decided by captures alone.
+    # Distances here are move values: a loss in n plies, counting the move that starts it
+    wins = defaultdict(list)
+    losses = defaultdict(list)
+    longest_loss = bytearray(size)
+    for index in range(size):
+        if not valid[index]:
+            continue
+        best = capture_values[index]
+        if best == NO_CAPTURES:
+            continue
+        if best > 0:
+            wins[best].append(index)
+        else:
+            longest_loss[index] = -best
+            if best < 0 and quiet_counts[index] == 0:
+                losses[-best].append(index)
+
+    # Retrograde pass, one distance at a time so every position gets its shortest win
+    values = array('b', bytes(size))
+    resolved = bytearray(size)
+    distance = 1
+    while distance <= max(list(wins) + list(losses) + [0]):
+        if distance > MAX_DISTANCE:
+            raise ExecutionError(f"Table {name} has distances beyond {MAX_DISTANCE} plies.")
+
+        # Each whole frontier is expanded at once, so the predecessors can be found in parallel
+        frontier = _take_unresolved(losses.pop(distance, []), resolved)
+        for index in frontier:
+            values[index] = -distance
+        for previous_indexes in expand(frontier):
+            for previous in previous_indexes:
+                if not resolved[previous]:
+                    wins[distance + 1].append(previous)
+
+        frontier = _take_unresolved(wins.pop(distance, []), resolved)
+        for index in frontier:
+            values[index] = distance
+        for previous_indexes in expand(frontier):
+            for previous in previous_indexes:
+                if resolved[previous]:
+                    continue
+                quiet_counts[previous] -= 1
+                # Moving into a win in n plies for the opponent loses in n + 1
+                longest_loss[previous] = max(longest_loss[previous], distance + 1)
+                # A capture that draws or wins keeps the position from being lost
+                if quiet_counts[previous] == 0 and capture_values[previous] < 0:
+                    losses[longest_loss[previous]].append(previous)
+        distance += 1
+    return values
+
+
+def generate_tablebase(name, directory, workers=None, regenerate=False):
+    """Generates the table of a material (and any smaller table it needs) into a directory"""
+    name = material_name(*parse_material(name))
+    if len(name) - 1 > MAX_PIECES:
+        raise ValueError(f"Material '{name}' has more than {MAX_PIECES} pieces, which is not supported.")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, name + FILE_EXTENSION)
+
+    for sub_name in sub_materials(name):
+        if regenerate or not os.path.exists(os.path.join(directory, sub_name + FILE_EXTENSION)):
+            generate_tablebase(sub_name, directory, workers, regenerate=False)
+    if os.path.exists(path) and not regenerate:
+        return path
+
+    size = table_size(table_groups(name))
+    workers = workers or os.cpu_count() or 1
+
+    quiet_counts = bytearray(size)
+    capture_values = array('b', bytes(size))
+    valid = bytearray(size)
+    chunk = max(4096, size // (workers * 16))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Forward pass over every position, split across all cores
+        futures = [executor.submit(_scan_chunk, name, directory, start, min(start + chunk, size))
+                   for start in range(0, size, chunk)]
+        for future in futures:
+            start, chunk_counts, chunk_values, chunk_valid = future.result()
+            stop = start + len(chunk_counts)
+            quiet_counts[start:stop] = chunk_counts
+            capture_values[start:stop] = array('b', chunk_values)
+            valid[start:stop] = chunk_valid
+
+        def expand(indexes):
+            """Finds the predecessors of a frontier on every core"""
+            step = max(256, -(-len(indexes) // (workers * 4)))
+            parts = executor.map(_predecessor_chunk, repeat(name),
+                                 [indexes[start:start + step] for start in range(0, len(indexes), step)])
+            return [previous_indexes for part in parts for previous_indexes in part]
+
+        values = _retrograde(name, valid, quiet_counts, capture_values, expand)
+
+    with open(path, 'wb') as table_file:
+        table_file.write(MAGIC + name.encode('ascii').ljust(HEADER_SIZE - len(MAGIC), b'\0'))
+        table_file.write(values.tobytes())
+    return path
+
+
+# CONSISTENCY CHECK
+def _check_chunk(name, directory, start, stop, step):
+    """Lists the indexes in a range whose stored value differs from the best value among their moves"""
+    global _worker_tablebase, _worker_game
+    if _worker_tablebase is None:
+        _worker_tablebase = Tablebase(directory)
+        _worker_game = ChessVar(verbose=False)
+
+    groups = table_groups(name)
+    mismatches = []
+    for index in range(start, stop, step):
+        position = index_board(index, groups)
+        if position is None:
+            continue
+        board, player_turn = position
+
+        # Positions without any move stay drawn
+        best = None
+        for src_square, dest_square in generate_moves(board, player_turn):
+            _worker_game.set_position(dict(board), player_turn)
+            _worker_game.make_move(src_square, dest_square)
+            game_state = _worker_game.get_game_state()
+            if game_state in ('WHITE_WON', 'BLACK_WON'):
+                move_value = 1 if game_state == f"{player_turn}_WON" else -1
+            else:
+                move_value = step_back(_worker_tablebase.probe_value(_worker_game.get_board(),
+                                                                     other_turn(player_turn)))
+            if best is None or move_value_rank(move_value) > move_value_rank(best):
+                best = move_value
+
+        if _worker_tablebase.probe_value(board, player_turn) != (best or 0):
+            mismatches.append(index)
+    return mismatches
+
+
+def check_tablebase(name, directory, workers=None, step=1):
+    """Checks that every position of a table, or every step-th index, holds the best value of its moves.
+
+    Gets the indexes that do not.
+    """
+    name = material_name(*parse_material(name))
+    size = table_size(table_groups(name))
+    workers = workers or os.cpu_count() or 1
+
+    chunk = max(4096, size // (workers * 16))
+    chunk -= chunk % step
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_check_chunk, name, directory, start, min(start + chunk, size), step)
+                   for start in range(0, size, chunk)]
+        return [index for future in futures for index in future.result()]
+
+
+# MAIN
+def main():
+    parser = argparse.ArgumentParser(description=f"Generate atomic endgame tablebases of up to {MAX_PIECES} pieces.")
+    parser.add_argument('materials', nargs='+', help="material names such as KQvK KRvK KNNvK")
+    parser.add_argument('--directory', default='tablebases', help="directory for the table files")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (defaults to all cores)")
+    parser.add_argument('--regenerate', action='store_true', help="rebuild tables that already exist")
+    parser.add_argument('--check', type=int, metavar='STEP', default=0,
+                        help="afterwards check every STEP-th position against the values of its moves")
+    args = parser.parse_args()
+
+    for name in args.materials:
+        print(generate_tablebase(name, args.directory, args.workers, args.regenerate))
+        if args.check:
+            mismatches = check_tablebase(name, args.directory, args.workers, args.check)
+            print(f"{len(mismatches)} inconsistent positions in {name}")
+            if mismatches:
+                raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,198 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Engine-vs-engine tournament runner with a sequential probability ratio test
+
+import argparse
+import json
+import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from ChessBook import parse_moves, read_games
+from ChessMCTS import MCTSPlayer
+from ChessVar import ChessVar
+
+# Games longer than this are scored as a draw
+MAX_PLIES = 200
+
+# Keys of an engine configuration that go to the search rather than to MCTSPlayer
+SEARCH_KEYS = ('playouts', 'time_limit')
+
+
+# SPRT
+def expected_score(elo):
+    """Gets the expected score of a player rated elo points above its opponent"""
+    return 1 / (1 + 10 ** (-elo / 400))
+
+
+class SPRT:
+    """Sequential probability ratio test between H0: elo = elo0 and H1: elo = elo1, using the trinomial model"""
+
+    def __init__(self, elo0=0.0, elo1=5.0, alpha=0.05, beta=0.05):
+        self._elo0 = elo0
+        self._elo1 = elo1
+        self._lower = math.log(beta / (1 - alpha))
+        self._upper = math.log((1 - beta) / alpha)
+        self._wins = 0
+        self._draws = 0
+        self._losses = 0
+
+    def add(self, score):
+        """Adds one game scored 1, 0.5 or 0 for the first engine"""
+        if score == 1:
+            self._wins += 1
+        elif score == 0:
+            self._losses += 1
+        else:
+            self._draws += 1
+
+    def get_counts(self):
+        """Gets (wins, draws, losses) of the first engine"""
+        return self._wins, self._draws, self._losses
+
+    def get_bounds(self):
+        """Gets (lower, upper) log-likelihood ratio bounds"""
+        return self._lower, self._upper
+
+    def llr(self):
+        """Gets the log-likelihood ratio of H1 over H0 under a normal approximation of the score"""
+        games = self._wins + self._draws + self._losses
+        if not games:
+            return 0.0
+
+        win, draw, loss = self._wins / games, self._draws / games, self._losses / games
+        score = win + draw / 2
+        variance = win * (1 - score) ** 2 + draw * (0.5 - score) ** 2 + loss * score ** 2
+        # Identical results every game leave nothing to estimate the spread from
+        if variance == 0:
+            return 0.0
+        score0, score1 = expected_score(self._elo0), expected_score(self._elo1)
+        return (score1 - score0) * (2 * score - score0 - score1) * games / (2 * variance)
+
+    def get_status(self):
+        """Gets 'H1' once the first engine is accepted as stronger, 'H0' once rejected, else 'CONTINUE'"""
+        llr = self.llr()
+        if llr >= self._upper:
+            return 'H1'
+        if llr <= self._lower:
+            return 'H0'
+        return 'CONTINUE'
+
+
+# GAMES
+def play_game(opening, white_config, black_config, max_plies=MAX_PLIES, seed=None):
+    """Plays one game from an opening and gets (game state, plies played)"""
+    game = ChessVar(verbose=False)
+    for move in opening:
+        if not game.make_move(*move):
+            raise ValueError(f"Opening move {move[0]}{move[1]} is not legal.")
+
+    players = {}
+    limits = {}
+    for player_turn, config in (('WHITE', white_config), ('BLACK', black_config)):
+        options = {key: value for key, value in config.items() if key not in SEARCH_KEYS}
+        # Games already run side by side, so each engine rolls out in its own process
+        players[player_turn] = MCTSPlayer(workers=1, seed=seed, **options)
+        limits[player_turn] = {key: config[key] for key in SEARCH_KEYS if key in config}
+
+    while game.get_game_state() == 'UNFINISHED' and game.get_ply() < max_plies:
+        player_turn = game.get_player_turn()
+        move = players[player_turn].choose_move(game, **limits[player_turn])
+        if move is None:
+            break
+        game.make_move(*move)
+
+    game_state = game.get_game_state()
+    return ('DRAW' if game_state == 'UNFINISHED' else game_state), game.get_ply()
+
+
+def _play_pairing(number, opening, config_a, config_b, a_is_white, max_plies):
+    """Plays one game of a pair in a worker process and gets (number, score of engine A, game state, plies)"""
+    if a_is_white:
+        game_state, plies = play_game(opening, config_a, config_b, max_plies, seed=number)
+        score = {'WHITE_WON': 1, 'BLACK_WON': 0}.get(game_state, 0.5)
+    else:
+        game_state, plies = play_game(opening, config_b, config_a, max_plies, seed=number)
+        score = {'WHITE_WON': 0, 'BLACK_WON': 1}.get(game_state, 0.5)
+    return number, score, game_state, plies
+
+
+# TOURNAMENT CLASS
+class Tournament:
+    """Plays paired games between engine configurations A and B across processes, stopping early on SPRT"""
+
+    def __init__(self, config_a, config_b, openings, max_games=1000, workers=None, sprt=None,
+                 max_plies=MAX_PLIES):
+        if not openings:
+            raise ValueError("A tournament needs at least one start position.")
+        self._config_a = config_a
+        self._config_b = config_b
+        self._openings = openings
+        self._max_games = max_games
+        self._workers = workers or os.cpu_count() or 1
+        self._sprt = sprt or SPRT()
+        self._max_plies = max_plies
+
+    def get_sprt(self):
+        """Gets the SPRT fed with the results so far"""
+        return self._sprt
+
+    def run(self):
+        """Plays games and yields (game number, score of A, game state, plies, SPRT status) as each one finishes"""
+        # Game 2n and 2n + 1 share an opening with colors swapped
+        pairings = ((number, self._openings[number // 2 % len(self._openings)], number % 2 == 0)
+                    for number in range(self._max_games))
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            pending = set()
+            status = 'CONTINUE'
+            while status == 'CONTINUE':
+                # Only a few games are queued ahead, so an early stop wastes little work
+                for number, opening, a_is_white in pairings:
+                    pending.add(executor.submit(_play_pairing, number, opening, self._config_a, self._config_b,
+                                                a_is_white, self._max_plies))
+                    if len(pending) >= self._workers * 2:
+                        break
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    number, score, game_state, plies = future.result()
+                    self._sprt.add(score)
+                    status = self._sprt.get_status()
+                    yield number, score, game_state, plies, status
+
+            for future in pending:
+                future.cancel()
+
+
+# MAIN
+def main():
+    parser = argparse.ArgumentParser(description="Play engine A against engine B until SPRT decides.")
+    parser.add_argument('--engine-a', default='{"playouts": 200}', help="JSON options of engine A")
+    parser.add_argument('--engine-b', default='{"playouts": 200}', help="JSON options of engine B")
+    parser.add_argument('--openings', help="file with one opening per line, moves written like 'a2a4'")
+    parser.add_argument('--games', type=int, default=1000, help="most games to play")
+    parser.add_argument('--workers', type=int, default=None, help="game processes (defaults to all cores)")
+    parser.add_argument('--elo0', type=float, default=0.0)
+    parser.add_argument('--elo1', type=float, default=5.0)
+    parser.add_argument('--alpha', type=float, default=0.05)
+    parser.add_argument('--beta', type=float, default=0.05)
+    args = parser.parse_args()
+
+    openings = list(read_games(args.openings)) if args.openings else [parse_moves('')]
+    tournament = Tournament(json.loads(args.engine_a), json.loads(args.engine_b), openings, args.games,
+                            args.workers, SPRT(args.elo0, args.elo1, args.alpha, args.beta))
+
+    status = 'CONTINUE'
+    for number, score, game_state, plies, status in tournament.run():
+        wins, draws, losses = tournament.get_sprt().get_counts()
+        print(f"game {number}: {game_state} in {plies} plies, A scored {score} | "
+              f"+{wins} ={draws} -{losses} LLR {tournament.get_sprt().llr():.2f}")
+    print(f"SPRT result: {status}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,291 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: UCI protocol adapter that plays atomic chess over stdin/stdout
+
+import os
+import sys
+import threading
+import time
+
+from ChessPieces import make_piece
+from ChessMCTS import MCTSPlayer
+from ChessVar import ChessVar
+
+ENGINE_NAME = "ChessVar Atomic MCTS"
+ENGINE_AUTHOR = "Rafael Ayala"
+VARIANT = 'atomic'
+
+# Share of the remaining clock spent on one move when the GUI gives no moves-to-go
+DEFAULT_MOVES_TO_GO = 30
+# Kept back from every time budget for the pipe round trip
+MOVE_OVERHEAD_MS = 30
+# MCTS has no search depth, so 'go depth N' and 'go mate N' buy this many playouts per ply
+PLAYOUTS_PER_PLY = 100
+# Playouts of a 'go' that sets no limit at all, so the GUI still gets a move without sending 'stop'
+DEFAULT_PLAYOUTS = 1000
+
+
+# POSITION HELPERS
+def game_from_fen(fen):
+    """Builds a game from the piece placement and side to move fields of a FEN string"""
+    fields = fen.split()
+    if len(fields) < 2 or fields[1] not in ('w', 'b'):
+        raise ValueError(f"'{fen}' is not a FEN string.")
+
+    ranks = fields[0].split('/')
+    if len(ranks) != 8:
+        raise ValueError(f"'{fen}' does not describe eight ranks.")
+
+    board = {}
+    for rank_index, rank in enumerate(ranks):
+        row = 8 - rank_index
+        col = 0
+        for letter in rank:
+            if letter.isdigit():
+                col += int(letter)
+                continue
+            if col > 7 or letter.upper() not in 'PRNBQK':
+                raise ValueError(f"'{fen}' has a bad rank '{rank}'.")
+            code = ('W' if letter.isupper() else 'B') + letter.upper()
+            # Pawns can only have moved if they left their starting rank
+            start_row = 2 if code == 'WP' else 7
+            board[f"{'abcdefgh'[col]}{row}"] = make_piece(code, code[1] == 'P' and row != start_row)
+            col += 1
+
+    game = ChessVar(verbose=False)
+    game.set_position(board, 'WHITE' if fields[1] == 'w' else 'BLACK')
+    return game
+
+
+def parse_move(text):
+    """Turns UCI move text such as 'e2e4' into a (source, destination) pair"""
+    text = text.lower()
+    if len(text) != 4:
+        raise ValueError(f"'{text}' is not a move.")
+    return text[:2], text[2:]
+
+
+# UCI ENGINE CLASS
+class UCIEngine:
+    """Reads UCI commands and searches on a background thread so 'stop' and 'isready' are answered at once"""
+
+    def __init__(self, input_stream=None, output_stream=None, workers=None):
+        self._input = input_stream or sys.stdin
+        self._output = output_stream or sys.stdout
+        self._output_lock = threading.Lock()
+        self._workers = workers or os.cpu_count() or 1
+        self._player = None
+        self._game = ChessVar(verbose=False)
+
+        # State of the search in progress
+        self._search_thread = None
+        self._stop_event = threading.Event()
+        self._timer = None
+        self._pondering = False
+        self._ponder_budget = None
+
+    def run(self):
+        """Handles commands until 'quit' or the end of input"""
+        for line in self._input:
+            if not self.handle(line):
+                break
+        self._stop_search()
+        if self._player is not None:
+            self._player.close()
+
+    def handle(self, line):
+        """Handles one command line. Returns False once the engine should quit"""
+        tokens = line.split()
+        if not tokens:
+            return True
+        command, arguments = tokens[0], tokens[1:]
+
+        if command == 'uci':
+            self._send(f"id name {ENGINE_NAME}")
+            self._send(f"id author {ENGINE_AUTHOR}")
+            self._send(f"option name UCI_Variant type combo default {VARIANT} var {VARIANT}")
+            self._send(f"option name Threads type spin default {self._workers} min 1 max 256")
+            self._send("option name Ponder type check default true")
+            self._send("uciok")
+        elif command == 'isready':
+            self._send("readyok")
+        elif command == 'setoption':
+            self._set_option(arguments)
+        elif command == 'ucinewgame':
+            self._stop_search()
+            self._game = ChessVar(verbose=False)
+        elif command == 'position':
+            self._stop_search()
+            self._set_position(arguments)
+        elif command == 'go':
+            self._go(arguments)
+        elif command == 'stop':
+            self._stop_search()
+        elif command == 'ponderhit':
+            self._ponderhit()
+        elif command == 'quit':
+            return False
+        else:
+            self._send(f"info string unknown command {command}")
+        return True
+
+    def _send(self, message):
+        """Writes one line for the GUI"""
+        with self._output_lock:
+            self._output.write(message + '\n')
+            self._output.flush()
+
+    def _set_option(self, arguments):
+        """Handles 'setoption name <name> value <value>'"""
+        if 'name' not in arguments:
+            return
+        value_at = arguments.index('value') if 'value' in arguments else len(arguments)
+        name = ' '.join(arguments[arguments.index('name') + 1:value_at])
+        value = ' '.join(arguments[value_at + 1:])
+
+        if name == 'UCI_Variant' and value.lower() != VARIANT:
+            self._send(f"info string variant {value} is not supported, only {VARIANT}")
+        elif name == 'Threads' and value.isdigit():
+            self._stop_search()
+            if self._player is not None:
+                self._player.close()
+                self._player = None
+            self._workers = max(1, int(value))
+
+    def _set_position(self, arguments):
+        """Handles 'position startpos|fen <fen> [moves ...]'"""
+        moves_at = arguments.index('moves') if 'moves' in arguments else len(arguments)
+        try:
+            if arguments and arguments[0] == 'fen':
+                game = game_from_fen(' '.join(arguments[1:moves_at]))
+            else:
+                game = ChessVar(verbose=False)
+
+            for text in arguments[moves_at + 1:]:
+                move = parse_move(text)
+                if move not in game.get_legal_moves():
+                    raise ValueError(f"illegal move {text}")
+                game.make_move(*move)
+        except ValueError as error:
+            self._send(f"info string {error}")
+            return
+        self._game = game
+
+    def _go(self, arguments):
+        """Handles 'go' by starting a search thread"""
+        self._stop_search()
+        options = {}
+        flags = set()
+        for index, token in enumerate(arguments):
+            if token in ('infinite', 'ponder'):
+                flags.add(token)
+            elif index + 1 < len(arguments) and arguments[index + 1].lstrip('-').isdigit():
+                options[token] = int(arguments[index + 1])
+
+        budget = self._time_budget(options)
+        playouts = self._playout_budget(options, flags, budget)
+        self._pondering = 'ponder' in flags
+        self._ponder_budget = budget if self._pondering else None
+
+        self._stop_event = threading.Event()
+        if budget is not None and not self._pondering and 'infinite' not in flags:
+            self._start_timer(budget)
+
+        if self._player is None:
+            self._player = MCTSPlayer(workers=self._workers)
+        self._search_thread = threading.Thread(
+            target=self._search, args=(self._game, playouts, self._stop_event), daemon=True)
+        self._search_thread.start()
+
+    def _playout_budget(self, options, flags, time_budget):
+        """Gets the playouts to search, or None when only the clock or 'stop' ends the search"""
+        limits = []
+        if 'nodes' in options:
+            limits.append(options['nodes'])
+        if 'depth' in options:
+            limits.append(max(options['depth'], 1) * PLAYOUTS_PER_PLY)
+        if 'mate' in options:
+            # A mate in N moves lies 2N - 1 plies ahead
+            limits.append(max(2 * options['mate'] - 1, 1) * PLAYOUTS_PER_PLY)
+        if limits:
+            return min(limits)
+        if time_budget is None and not flags:
+            return DEFAULT_PLAYOUTS
+        return None
+
+    def _time_budget(self, options):
+        """Gets seconds to spend on this move, or None when the GUI gave no clock"""
+        if 'movetime' in options:
+            milliseconds = options['movetime']
+        else:
+            side = 'w' if self._game.get_player_turn() == 'WHITE' else 'b'
+            if f"{side}time" not in options:
+                return None
+            moves_to_go = options.get('movestogo') or DEFAULT_MOVES_TO_GO
+            milliseconds = options[f"{side}time"] / moves_to_go + options.get(f"{side}inc", 0) * 0.8
+        return max(milliseconds - MOVE_OVERHEAD_MS, 1) / 1000
+
+    def _start_timer(self, seconds):
+        """Sets the stop event once the time budget is spent"""
+        self._timer = threading.Timer(seconds, self._stop_event.set)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _search(self, game, playouts, stop_event):
+        """Runs on the search thread and reports the best move"""
+        start = time.monotonic()
+        try:
+            statistics = self._player.search(game, playouts=playouts, stop_event=stop_event)
+        except Exception as error:
+            # The GUI waits for a 'bestmove' after every 'go', even one whose search failed
+            statistics = None
+            self._send(f"info string search failed: {error!r}")
+
+        # While pondering the GUI waits for 'ponderhit' or 'stop' before it wants a move
+        while self._pondering and not stop_event.is_set():
+            stop_event.wait(0.01)
+
+        if statistics is None:
+            self._send("bestmove 0000")
+            return
+
+        elapsed_ms = int((time.monotonic() - start) * 1000)
+        line = self._player.get_principal_variation()
+        pv = ' '.join(src + dest for src, dest in line)
+        self._send(f"info nodes {self._player.get_playout_count()} time {elapsed_ms} pv {pv}".rstrip())
+
+        if not statistics:
+            self._send("bestmove 0000")
+        elif len(line) > 1:
+            self._send(f"bestmove {''.join(line[0])} ponder {''.join(line[1])}")
+        else:
+            self._send(f"bestmove {statistics[0][0]}{statistics[0][1]}")
+
+    def _ponderhit(self):
+        """The expected move was played, so the ponder search turns into a normal timed search"""
+        if not self._pondering:
+            return
+        self._pondering = False
+        if self._ponder_budget is not None:
+            self._start_timer(self._ponder_budget)
+
+    def _stop_search(self):
+        """Stops the search thread and waits for its 'bestmove'"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self._pondering = False
+        self._stop_event.set()
+        if self._search_thread is not None:
+            self._search_thread.join()
+            self._search_thread = None
+
+
+# MAIN
+def main():
+    UCIEngine().run()
+
+
+if __name__ == '__main__':
+    main()
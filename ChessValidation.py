@@ -0,0 +1,74 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Batch move validation against one position with an LRU cache keyed by position hash
+
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_POSITIONS = 4096
+
+
+# MOVE VALIDATOR CLASS
+class MoveValidator:
+    """Generates the legal moves of a position once and answers every query about it by membership"""
+
+    def __init__(self, max_positions=DEFAULT_MAX_POSITIONS):
+        if max_positions < 1:
+            raise ValueError("The cache must hold at least one position.")
+        self._max_positions = max_positions
+        # Position hash -> {source square: frozenset of destination squares}, least recently used first
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def validate_moves(self, game, moves):
+        """Gets one True/False per (source, destination) pair, in the order given"""
+        legal_moves = self._legal_moves(game)
+        empty = frozenset()
+        return [dest_square.lower() in legal_moves.get(src_square.lower(), empty) for src_square, dest_square in moves]
+
+    def get_destinations(self, game, src_square):
+        """Gets the sorted destination squares the piece on a source square may move to"""
+        return sorted(self._legal_moves(game).get(src_square.lower(), ()))
+
+    def is_legal(self, game, src_square, dest_square):
+        """Checks a single move"""
+        return self.validate_moves(game, [(src_square, dest_square)])[0]
+
+    def get_stats(self):
+        """Gets (cache hits, cache misses, cached positions)"""
+        return self._hits, self._misses, len(self._cache)
+
+    def clear(self):
+        """Empties the cache"""
+        with self._lock:
+            self._cache.clear()
+
+    def _legal_moves(self, game):
+        """Gets the legal moves of a game's position grouped by source square, generating them on a cache miss"""
+        key = game.get_position_hash()
+        with self._lock:
+            legal_moves = self._cache.get(key)
+            if legal_moves is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return legal_moves
+
+        # Generate outside the lock, other clients keep reading meanwhile
+        # Only a missing King ends move generation. Draws depend on the move history, not just on the
+        # position, so they must not decide what gets cached under the position hash
+        grouped = {}
+        if game.get_game_state() not in ('WHITE_WON', 'BLACK_WON'):
+            for src_square, dest_square in game.get_legal_moves():
+                grouped.setdefault(src_square, set()).add(dest_square)
+        legal_moves = {src_square: frozenset(dest_squares) for src_square, dest_squares in grouped.items()}
+
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = legal_moves
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._max_positions:
+                self._cache.popitem(last=False)
+        return legal_moves
@@ -3,353 +3,177 @@
 # Date: 5/25/24
 # Description: Chessboard Variant (Atomic) Game
 
+# Rules live in ChessPieces and ChessBoard. Their names are imported here too, so
+# "from ChessVar import ..." keeps working for every piece, rule and board helper.
+from ChessPieces import (Piece, Pawn, Rook, Knight, Bishop, Queen, King, PIECE_CLASSES, ExecutionError,
+                         make_piece, verify_move, is_path_clear, generate_moves, candidate_squares)
+from ChessBoard import ChessBoard, SQUARE_NEIGHBOURS, ZOBRIST_BLACK_TO_MOVE, position_hash, square_hash
+from ChessEvents import BoardDiff
+from ChessHistory import MoveHistory, MoveRecord
 
-# CHESS PIECE CLASSES
-class Piece:
-    """Creates base Piece object that specific chess pieces inherit from"""
+# A game is drawn after this many plies without a capture or a pawn move
+FIFTY_MOVE_PLIES = 100
 
-    def __init__(self, color):
-        self._color = color
 
-    def __str__(self):
-        raise ExecutionError("Subclass must implement __str__ method.")
-
-    def move(self):
-        raise ExecutionError("Subclass must implement the move method.")
-
-    def get_color(self):
-        return self._color
-
-
-class Pawn(Piece):
-    "Creates a Pawn"
-
-    def __init__(self, color):
-        super().__init__(color)
-        self._has_moved = False
-
-    # This is what will be called by the str('Piece Type') call
-    def __str__(self):
-        return 'WP' if self._color == 'WHITE' else 'BP'
-
-    def has_moved(self):
-        return self._has_moved
-
-    def set_has_moved(self, has_moved=True):
-        self._has_moved = has_moved
-
-
-class Rook(Piece):
-    """Creates a Rook"""
-
-    def __init__(self, color):
-        super().__init__(color)
-
-    # This is what will be called by the str('Piece Type') call
-    def __str__(self):
-        return 'WR' if self._color == 'WHITE' else 'BR'
-
-
-class Knight(Piece):
-    """Creates a Knight"""
-
-    def __init__(self, color):
-        super().__init__(color)
-
-    # This is what will be called by the str('Piece Type') call
-    def __str__(self):
-        return 'WN' if self._color == 'WHITE' else 'BN'
-
-
-class Bishop(Piece):
-    """Creates a Bishop"""
-
-    def __init__(self, color):
-        super().__init__(color)
-
-    # This is what will be called by the str('Piece Type') call
-    def __str__(self):
-        return 'WB' if self._color == 'WHITE' else 'BB'
-
-
-class Queen(Piece):
-    """Creates a Queen"""
-
-    def __init__(self, color):
-        super().__init__(color)
-
-    # This is what will be called by the str('Piece Type') call
-    def __str__(self):
-        return 'WQ' if self._color == 'WHITE' else 'BQ'
-
-
-class King(Piece):
-    """Creates a King"""
-
-    def __init__(self, color):
-        super().__init__(color)
-
-    # This is what will be called by the str('Piece Type') call
-    def __str__(self):
-        return 'WK' if self._color == 'WHITE' else 'BK'
-
-
-# VERIFICATION METHODS
-def verify_move(chess_piece, src_square, dest_square, board):
-    """Verifies move of piece type"""
-
-    # Column map used to pair string characters to integers
-    COLUMN_MAP = {
-        'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6, 'g': 7, 'h': 8
-    }
-
-    src_row = int(src_square[1])
-    src_col = COLUMN_MAP[src_square[0].lower()]
-
-    dest_row = int(dest_square[1])
-    dest_col = COLUMN_MAP[dest_square[0].lower()]
-
-    # PAWN VERIFICATION - Can move forward 1 or 2 squares at first turn and 1 square only after first turn
-    if isinstance(chess_piece, Pawn):
-        if chess_piece.get_color() == "WHITE":
-            if dest_row == src_row + 1 and dest_col == src_col and is_path_clear(board, src_square, dest_square):
-                return f"{dest_square[0]}{dest_row}" not in board
-
-            elif (dest_row == src_row + 2 and dest_col == src_col and not chess_piece.has_moved()
-                  and is_path_clear(board, src_square, dest_square)):
-                return f"{dest_square[0]}{dest_row}" not in board and f"{src_square[0]}{src_row + 1}" not in board
-
-            elif (dest_row == src_row + 1 and abs(dest_col - src_col) == 1
-                  and is_path_clear(board, src_square, dest_square)):
-                return f"{dest_square[0]}{dest_row}" in board
-        else:
-            if dest_row == src_row - 1 and dest_col == src_col and is_path_clear(board, src_square, dest_square):
-                return f"{dest_square[0]}{dest_row}" not in board
-            elif (dest_row == src_row - 2 and dest_col == src_col and not chess_piece.has_moved()
-                  and is_path_clear(board, src_square, dest_square)):
-                return f"{dest_square[0]}{dest_row}" not in board and f"{src_square[0]}{src_row - 1}" not in board
-
-            elif (dest_row == src_row - 1 and abs(dest_col - src_col) == 1
-                  and is_path_clear(board, src_square, dest_square)):
-                return f"{dest_square[0]}{dest_row}" in board
-
-        return False
-
-    # ROOK VERIFICATION - Can move horizontally and vertically in unlimited squares
-    elif isinstance(chess_piece, Rook):
-        if (dest_row == src_row or dest_col == src_col) and is_path_clear(board, src_square, dest_square):
-            return True
-        return False
-
-    # KNIGHT VERIFICATION - Can move in an L-pattern (3 row squares and 2 col squares)
-    elif isinstance(chess_piece, Knight):
-        row_diff = abs(dest_row - src_row)
-        col_diff = abs(dest_col - src_col)
-        if (row_diff == 2 and col_diff == 1) or (row_diff == 1 and col_diff == 2):
-            return True
-        return False
-
-    # BISHOP VERIFICATION - Can move diagonally in unlimited squares
-    elif isinstance(chess_piece, Bishop):
-        if abs(dest_row - src_row) == abs(dest_col - src_col) and is_path_clear(board, src_square, dest_square):
-            return True
-        return False
-
-    # QUEEN VERIFICATION - Can move unlimited squares in all directions
-    elif isinstance(chess_piece, Queen):
-        if (dest_row == src_row or dest_col == src_col or abs(dest_row - src_row) == abs(
-                dest_col - src_col)) and is_path_clear(board, src_square, dest_square):
-            return True
-        return False
-
-    # KING VERIFICATION - Can move 1 square in all directions
-    elif isinstance(chess_piece, King):
-        if dest_square.lower() in board and isinstance(board[dest_square.lower()], Piece):
-            return False
-        return abs(dest_row - src_row) <= 1 and abs(dest_col - src_col) <= 1
-
-    return False
-
-
-def is_path_clear(board, src_square, dest_square):
-    """Checks if path is clear meaning there is no piece from the same team blocking its move"""
-
-    COLUMN_MAP = {
-        'a': 1, 'b': 2, 'c': 3, 'd': 4, 'e': 5, 'f': 6, 'g': 7, 'h': 8
-    }
-
-    src_col, src_row = src_square[0].lower(), int(src_square[1])
-    dest_col, dest_row = dest_square[0].lower(), int(dest_square[1])
-
-    src_col_num = COLUMN_MAP[src_col]
-    dest_col_num = COLUMN_MAP[dest_col]
-
-    if src_row == dest_row:  # Moving horizontally
-        if src_col_num < dest_col_num:
-            for col in range(src_col_num + 1, dest_col_num):
-                if f"{list(COLUMN_MAP.keys())[col - 1]}{src_row}" in board:
-                    return False
-        else:
-            for col in range(src_col_num - 1, dest_col_num, -1):
-                if f"{list(COLUMN_MAP.keys())[col - 1]}{src_row}" in board:
-                    return False
-    elif src_col_num == dest_col_num:  # Moving vertically
-        if src_row < dest_row:
-            for row in range(src_row + 1, dest_row):
-                if f"{src_col}{row}" in board:
-                    return False
-        else:
-            for row in range(src_row - 1, dest_row, -1):
-                if f"{src_col}{row}" in board:
-                    return False
-    else:  # Moving diagonally
-        row_step = 1 if dest_row > src_row else -1
-        col_step = 1 if dest_col_num > src_col_num else -1
-        col, row = src_col_num + col_step, src_row + row_step
-        while col != dest_col_num and row != dest_row:
-            if f"{list(COLUMN_MAP.keys())[col - 1]}{row}" in board:
-                return False
-            col += col_step
-            row += row_step
-    return True
-
-
-# CHESS BOARD CLASS
-class ChessBoard:
-    """Creates a chessboard"""
-
-    def __init__(self):
-        self._board = {}
-        self.reset_board()
-
-    def get_board(self):
-        """Gets board"""
-        return self._board
-
-    def reset_board(self):
-        """Resets board to default state."""
-
-        # Use dictionary to pair each board position with a default position for chess pieces
-        # Use dictionary to dynamically update positions on the board
-        # The dictionary does not contain empty spaces for memory efficiency
-        self._board = {
-            'a1': Rook('WHITE'), 'b1': Knight('WHITE'), 'c1': Bishop('WHITE'), 'd1': Queen('WHITE'),
-            'e1': King('WHITE'), 'f1': Bishop('WHITE'), 'g1': Knight('WHITE'), 'h1': Rook('WHITE'),
-            'a2': Pawn('WHITE'), 'b2': Pawn('WHITE'), 'c2': Pawn('WHITE'), 'd2': Pawn('WHITE'),
-            'e2': Pawn('WHITE'), 'f2': Pawn('WHITE'), 'g2': Pawn('WHITE'), 'h2': Pawn('WHITE'),
-            'a8': Rook('BLACK'), 'b8': Knight('BLACK'), 'c8': Bishop('BLACK'), 'd8': Queen('BLACK'),
-            'e8': King('BLACK'), 'f8': Bishop('BLACK'), 'g8': Knight('BLACK'), 'h8': Rook('BLACK'),
-            'a7': Pawn('BLACK'), 'b7': Pawn('BLACK'), 'c7': Pawn('BLACK'), 'd7': Pawn('BLACK'),
-            'e7': Pawn('BLACK'), 'f7': Pawn('BLACK'), 'g7': Pawn('BLACK'), 'h7': Pawn('BLACK'),
-        }
-
-    def move_piece(self, src_pos, dest_pos, player_color):
-        """Moves piece on a board"""
-
-        src_pos_lower = src_pos.lower()
-        dest_pos_lower = dest_pos.lower()
-
-        if src_pos_lower not in self._board:
-            # raise ValueError("Source position is not valid.")
-            print("Source position is not valid.")
-            return False
-
-        piece = self._board.get(src_pos_lower)
-        piece_move_verify = verify_move(piece, src_pos_lower, dest_pos_lower, self._board)
-
-        if not piece:
-            # raise ValueError("There is no piece at source position.")
-            print("There is no piece at source position.")
-            return False
-
-        # Check if piece can move to location
-        if not piece_move_verify:
-            # raise ExecutionError("Piece cannot move to an invalid location. Path has to be clear for piece to move "
-            #                      "(except for Knights) OR destined location is based on allowed movement"
-            #                      " patterns for specific piece type according to traditional chess rules.")
-            print("Piece cannot move to an invalid location. Path has to be clear for piece to move "
-                  "(except for Knights) OR destined location is based on allowed movement"
-                  " patterns for specific piece type according to traditional chess rules.")
-            return False
-
-        dest_piece = self._board.get(dest_pos_lower)
-        if dest_piece:
-            if dest_piece.get_color() == player_color:
-                # raise ValueError("Cannot capture own piece.")
-                print("Cannot capture own piece.")
-                return False
-
-            else:
-                self.capture(src_pos_lower, dest_pos_lower, piece)
-                return True
-
-        else:
-            # Update the destination position with capturing piece, if dest is empty
-            self._board[dest_pos_lower] = piece
-            # Remove piece from previous board source position
-            del self._board[src_pos_lower]
-
-        # SPECIAL PIECE CONDITIONS
-        # Update pawn's moved status if it's a pawn
-        if isinstance(piece, Pawn):
-            piece.set_has_moved()
-
-        return True
-
-    def capture(self, src_pos, dest_pos, piece):
-        """Source piece replaces destination piece"""
-        del self._board[dest_pos.lower()]
-        del self._board[src_pos.lower()]
-        self._board[dest_pos.lower()] = piece
-
-    def remove_piece(self, position):
-        """Removes piece from a specified position"""
-        if position in self._board:
-            del self._board[position]
-        else:
-            pass
-
-    def print_board(self):
-        """Prints board to console"""
-
-        # Top Border and Label
-        pipe_sep = " | "
-        print("       " + "     ".join("abcdefgh"))
-        print("    " + "+" + "-----+" * 8)  # Prints 8 times for number of rows
-        for row in range(8, 0, -1):
-            # Prints row number first
-            print(row, ' ', end=pipe_sep)  # Override default 'end' for print() method
-
-            # Since columns are labeled letters, we need to use the ASCII values of the character labels
-            for col in range(97, 105):
-                column_pos = chr(col)  # col is converted to string character based on the ASCII ranges in the for loop
-
-                # For example, c(col) + 8(row) is retrieved from the board dictionary as 'c8'
-                # Get chess piece from dictionary board
-                piece = self._board.get(f"{column_pos}{row}")
-
-                # If there is a piece in the position it gets __str__ of Piece, else it is an empty space
-                piece_str = str(piece) if piece else ' '
-                print("{:^3}".format(piece_str), end=pipe_sep)
-            print("  ", row)
-            print("    " + "+" + "-----+" * 8)
-        # Bottom Label
-        print("       " + "     ".join("abcdefgh"))
+def is_irreversible(record):
+    """Checks if a recorded move was a capture or a pawn move, after which no earlier position can return"""
+    return record.get_captured() is not None or record.get_piece()[1] == 'P'
 
 
 # CHESS VAR CLASS
 class ChessVar:
     """Create a chess variant game class"""
 
-    def __init__(self):
-        self._board = ChessBoard()
+    # Snapshot and hash of the starting position, shared by every reset
+    _start_position = None
+
+    def __init__(self, verbose=True):
+        self._board = ChessBoard(verbose)
         self._player_white = "WHITE"
         self._player_black = "BLACK"
         self._player_turn = "WHITE"
+        # Engines and table generators play thousands of moves and turn the console messages off
+        self._verbose = verbose
+        self._reset_history()
+        # Pieces removed by the latest explosion, gathered for the move history
+        self._exploded = []
+        # Callbacks that receive a BoardDiff after every move
+        self._subscribers = []
 
     def print_board(self):
         self._board.print_board()
 
+    def report(self, message):
+        """Prints a message to the console unless the game is silenced"""
+        if self._verbose:
+            print(message)
+
+    def reset(self):
+        """Sets up the starting position again in place, reusing the board, its pieces and the history.
+
+        Subscribers are removed, so a recycled game does not report to the watchers of its previous match.
+        """
+        self._board.reset_board()
+        self._player_turn = self._player_white
+        self._subscribers.clear()
+        self._exploded = []
+        self._ply = 0
+        # Every reset lands on the same position, so its snapshot and hash are only worked out once
+        if ChessVar._start_position is None:
+            ChessVar._start_position = (self.get_snapshot(),
+                                        position_hash(self._board.get_board(), self._player_turn))
+        snapshot, self._hash = ChessVar._start_position
+        self._history.reset(snapshot)
+        self._hash_history.clear()
+        self._hash_history.append(self._hash)
+        self._halfmove_clock = 0
+        self._repetitions.clear()
+        self._repetitions[self._hash] = 1
+
+    def set_verbose(self, verbose):
+        """Turns the console messages on or off"""
+        self._verbose = verbose
+        self._board.set_verbose(verbose)
+
+    def subscribe(self, callback):
+        """Registers a callback that receives a BoardDiff after every move.
+
+        A callback that raises is logged and skipped, the move stands and the other callbacks still run.
+        """
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        """Removes a registered callback"""
+        self._subscribers.remove(callback)
+
+    def get_board(self):
+        """Gets dictionary of positions and chess pieces"""
+        return self._board.get_board()
+
+    def set_position(self, board, player_turn):
+        """Sets up an arbitrary position from a dictionary of positions and chess pieces. Clears the history"""
+        self._board.set_board(board)
+        self.set_player_turn(player_turn)
+        self._reset_history()
+
+    def _reset_history(self):
+        """Starts the history, position hashes and draw counters over from the current position"""
+        # Number of moves played to reach the current position, moves past it are kept after a seek back
+        self._ply = 0
+        self._history = MoveHistory(self.get_snapshot())
+        self._hash = position_hash(self._board.get_board(), self._player_turn)
+        # Hash of the position at every ply, looked back on to rebuild the draw counters after a seek
+        self._hash_history = [self._hash]
+        # Moves since the last capture or pawn move, and how often each position occurred since then
+        self._halfmove_clock = 0
+        self._repetitions = {self._hash: 1}
+
+    def get_snapshot(self):
+        """Gets a compact copy of the position: (player turn, ((square, piece code, has moved), ...))"""
+        return self._player_turn, tuple(
+            (square, str(piece), isinstance(piece, Pawn) and piece.has_moved())
+            for square, piece in self._board.get_board().items())
+
+    def restore_snapshot(self, snapshot):
+        """Sets up the position of a snapshot. Clears the history"""
+        player_turn, pieces = snapshot
+        self.set_position({square: make_piece(code, has_moved) for square, code, has_moved in pieces}, player_turn)
+
+    def get_history(self):
+        """Gets list of move records, including moves past the current ply after a seek back"""
+        return self._history.get_records()
+
+    def get_move_record(self, ply):
+        """Gets the record of the move that led to a ply (ply 1 is the first move)"""
+        if not 1 <= ply <= len(self._history):
+            raise ValueError(f"Ply must be between 1 and {len(self._history)}.")
+        return self._history.get_record(ply)
+
+    def get_checkpoint(self, ply):
+        """Gets (checkpoint ply, snapshot) of the closest stored position at or before a ply"""
+        if not 0 <= ply <= len(self._history):
+            raise ValueError(f"Ply must be between 0 and {len(self._history)}.")
+        return self._history.nearest_checkpoint(ply)
+
+    def get_ply(self):
+        """Gets number of moves played to reach the current position"""
+        return self._ply
+
+    def seek(self, ply):
+        """Jumps to the position after a number of moves by restoring the nearest checkpoint and replaying the rest"""
+        if not 0 <= ply <= len(self._history):
+            raise ValueError(f"Ply must be between 0 and {len(self._history)}.")
+
+        checkpoint_ply, snapshot = self._history.nearest_checkpoint(ply)
+        player_turn, pieces = snapshot
+        self._board.set_board({square: make_piece(code, has_moved) for square, code, has_moved in pieces})
+        self._player_turn = player_turn
+        self._hash = position_hash(self._board.get_board(), player_turn)
+
+        for replay_ply in range(checkpoint_ply + 1, ply + 1):
+            record = self._history.get_record(replay_ply)
+            self._apply_move(record.get_source(), record.get_destination())
+        self._ply = ply
+
+        # Only the plies back to the last capture or pawn move count for the draw rules
+        self._halfmove_clock = 0
+        self._repetitions = {}
+        while True:
+            position = self._hash_history[ply]
+            self._repetitions[position] = self._repetitions.get(position, 0) + 1
+            if ply == 0 or is_irreversible(self._history.get_record(ply)):
+                break
+            self._halfmove_clock += 1
+            ply -= 1
+
+    def get_legal_moves(self):
+        """Gets (source, destination) pairs the current player is allowed to play"""
+        return generate_moves(self._board.get_board(), self._player_turn)
+
+    def get_position_hash(self):
+        """Gets the 64-bit hash of the current position, kept up to date move by move"""
+        return self._hash
+
     def get_player_turn(self):
         """Gets player turn"""
         return self._player_turn
@@ -357,11 +181,13 @@ class ChessVar:
     def set_player_turn(self, player):
         """Sets player turn"""
         self._player_turn = player.upper()
+        self._hash = position_hash(self._board.get_board(), self._player_turn)
 
     def get_game_state(self):
-        """Gets game state. Returns winner or if game is unfinished"""
+        """Gets game state. Returns winner, DRAW or if game is unfinished"""
         white_king_present = False
         black_king_present = False
+        other_pieces_present = False
 
         for piece in self._board.get_board().values():
             # Check if King is still present for both players
@@ -370,14 +196,35 @@ class ChessVar:
                     white_king_present = True
                 elif piece.get_color() == 'BLACK':
                     black_king_present = True
+            else:
+                other_pieces_present = True
 
         # If King is not present, determine winner
         if not white_king_present:
             return 'BLACK_WON'
         elif not black_king_present:
             return 'WHITE_WON'
+        elif self._get_draw_reason(other_pieces_present):
+            return 'DRAW'
         return 'UNFINISHED'
 
+    def get_draw_reason(self):
+        """Gets 'INSUFFICIENT_MATERIAL', 'FIFTY_MOVES' or 'THREEFOLD_REPETITION' for a drawn game, else None"""
+        if self.get_game_state() != 'DRAW':
+            return None
+        return self._get_draw_reason(any(not isinstance(piece, King) for piece in self._board.get_board().values()))
+
+    def _get_draw_reason(self, other_pieces_present):
+        """Checks the draw rules, each in constant time"""
+        # Kings can never capture, so two bare Kings cannot end the game
+        if not other_pieces_present:
+            return 'INSUFFICIENT_MATERIAL'
+        if self._halfmove_clock >= FIFTY_MOVE_PLIES:
+            return 'FIFTY_MOVES'
+        if self._repetitions.get(self._hash, 0) >= 3:
+            return 'THREEFOLD_REPETITION'
+        return None
+
     def make_move(self, src_square, dest_square):
         """Makes move on board by specifying a source and destination position"""
         current_player = self._player_turn
@@ -386,61 +233,112 @@ class ChessVar:
 
         # Check if there is a piece in source square
         if not piece:
-            print("There is no piece at this source square.")
+            self.report("There is no piece at this source square.")
             return False
 
         # Check if it is current player's turn
         if piece.get_color() != current_player:
-            print("It is not this player color's turn.")
+            self.report("It is not this player color's turn.")
             return False
 
         # Validate that the destination square is within the board's boundaries
         if len(dest_square) != 2 or dest_square[0] not in 'abcdefgh' or dest_square[1] not in '12345678':
-            print("Invalid move. Destination square is outside the board's boundaries.")
+            self.report("Invalid move. Destination square is outside the board's boundaries.")
             return False
 
         # Check if destination square is occupied
         dest_piece = board.get_board().get(dest_square.lower())
+        if dest_piece and piece.get_color() == dest_piece.get_color():
+            self.report("Invalid move. Cannot move to a square occupied by a piece of the same color.")
+            return False
 
-        if dest_piece:
-            if piece.get_color() == dest_piece.get_color():
-                print("Invalid move. Cannot move to a square occupied by a piece of the same color.")
-                return False
+        move = self._apply_move(src_square.lower(), dest_square.lower())
+        if not move:
+            return False
+        piece_code, captured, exploded = move
+
+        # A move made after seeking back replaces the moves that followed
+        self._history.truncate(self._ply)
+        del self._hash_history[self._ply + 1:]
+        self._ply += 1
+        self._hash_history.append(self._hash)
+
+        # Draw counters restart at every capture or pawn move, since no earlier position can come back
+        if captured is not None or piece_code[1] == 'P':
+            self._halfmove_clock = 0
+            self._repetitions = {}
+        else:
+            self._halfmove_clock += 1
+        self._repetitions[self._hash] = self._repetitions.get(self._hash, 0) + 1
+
+        record = MoveRecord(src_square.lower(), dest_square.lower(), piece_code, captured, exploded,
+                            self.get_game_state())
+        self._history.append(record, self.get_snapshot)
+
+        # Spectators only need the squares that changed
+        if self._subscribers:
+            diff = BoardDiff.from_record(record, self._player_turn)
+            for callback in list(self._subscribers):
+                try:
+                    callback(diff)
+                except Exception:
+                    # Logging is only imported here, so worker processes never pay for it
+                    import logging
+                    logging.getLogger(__name__).exception("Board diff subscriber %r failed.", callback)
+
+        # Check if explosion captures a king
+        if any(code[1] == 'K' for _, code in record.get_exploded()):
+            # Print winner
+            self.report(record.get_result())
+        return True
 
-            else:
-                # If it is a valid move. Capture and explode
-                board.capture(src_square.lower(), dest_square.lower(), piece)
+    def _apply_move(self, src_square, dest_square):
+        """Moves the piece, captures and explodes, then switches player.
 
-                # After move completes, switch player
-                if current_player == self._player_white:
-                    self._player_turn = self._player_black
-                else:
-                    self._player_turn = self._player_white
+        Returns (moved piece code, captured piece code or None, exploded pieces), or None if the move failed.
+        """
+        board = self._board
+        current_player = self._player_turn
+        piece = board.get_board()[src_square]
+        dest_piece = board.get_board().get(dest_square)
+        self._exploded = []
 
-                # Check if explosion captures a king
-                king_captured = self.explode(dest_square.lower())
-                if king_captured:
-                    # Print and return winner
-                    print(self.get_game_state())
-                    return True
+        # Hash out every square the move can change, and hash the same squares back in afterwards.
+        # The source square may also touch the destination, so each square is only counted once
+        changed_squares = {src_square, dest_square}
+        if dest_piece:
+            changed_squares.update(SQUARE_NEIGHBOURS[dest_square])
+        position = board.get_board()
+        hash_before = 0
+        for square in changed_squares:
+            hash_before ^= square_hash(position.get(square), square)
 
-                return True
+        if dest_piece:
+            # If it is a valid move. Capture and explode
+            board.capture(src_square, dest_square, piece)
+            self._switch_player_turn()
+            self.explode(dest_square)
 
         else:
             # If square is empty, move the piece to the destination square
-            move_successful = board.move_piece(src_square, dest_square, current_player.upper())
-
-            # After move completes, switch player
-            if current_player == self._player_white:
-                self._player_turn = self._player_black
-            else:
-                self._player_turn = self._player_white
-
-            if move_successful:
-                return True
-
-            if not move_successful:
-                return False
+            if not board.move_piece(src_square, dest_square, current_player.upper()):
+                return None
+            self._switch_player_turn()
+
+        position = board.get_board()
+        hash_after = 0
+        for square in changed_squares:
+            hash_after ^= square_hash(position.get(square), square)
+        self._hash ^= hash_before ^ hash_after ^ ZOBRIST_BLACK_TO_MOVE
+
+        return str(piece), str(dest_piece) if dest_piece else None, tuple(self._exploded)
+
+    def _switch_player_turn(self):
+        """After move completes, switch player"""
+        if self._player_turn == self._player_white:
+            self._player_turn = self._player_black
+        else:
+            self._player_turn = self._player_white
 
     def explode(self, new_pos):
         """Removes pieces (8 squares) around the captor"""
@@ -485,6 +383,7 @@ class ChessVar:
                             # Check if King is caught in explosion
                             if isinstance(piece, King):
                                 king_captured = True
+                            self._exploded.append((exploded_pos, str(piece)))
                             self._board.remove_piece(exploded_pos)
 
         # Remove the capturing piece itself after explosions are complete
@@ -493,74 +392,15 @@ class ChessVar:
         return king_captured
 
 
-# EXCEPTION CLASSES
-class ExecutionError(Exception):
-    """Raises an execution error"""
-
-    def __init__(self, message="This method or function cannot be executed."):
-        self.message = message
-        super().__init__(self.message)
-
-
-# MAIN CLASSES
-def main():
-    game1 = ChessVar()
-
-    print("--------------------------------------------------------------------------------")
-    game1.make_move('a2', 'a3')  # WHITE - PAWN MOVES
-    game1.make_move('f7', 'f5')  # BLACK - PAWN MOVES
-    game1.make_move('a3', 'a4')  # WHITE - PAWN MOVES
-    game1.make_move('f5', 'f4')  # BLACK - PAWN MOVES
-
-    game1.make_move('a1', 'a3')  # WHITE - ROOK MOVES
-    game1.make_move('c7', 'c5')  # BLACK - PAWN MOVES
-    game1.make_move('a3', 'h3')  # WHITE - ROOK MOVES
-    game1.make_move('b8', 'c6')  # BLACK - KNIGHT MOVES
-
-    game1.make_move('b1', 'a3')  # WHITE - KNIGHT MOVES
-    game1.make_move('b7', 'b5')  # BLACK - PAWN MOVES
-    game1.make_move('b2', 'b4')  # WHITE - PAWN MOVES
-    game1.make_move('c8', 'b7')  # BLACK - BISHOP MOVES
-
-    game1.make_move('f2', 'f3')  # WHITE - PAWN MOVES
-    game1.make_move('d8', 'a5')  # BLACK - QUEEN MOVES
-    game1.make_move('b4', 'c5')  # WHITE - PAWN MOVES & CAPTURES PAWN + EXPLODE
-    game1.make_move('d7', 'd5')  # BLACK - PAWN MOVES
-
-    game1.make_move('h3', 'h7')  # WHITE - ROOK MOVES & CAPTURES PAWN + EXPLODE
-    game1.make_move('e8', 'd8')  # BLACK - KING MOVES
-    game1.make_move('a4', 'b5')  # WHITE - PAWN MOVES & CAPTURES PAWN + EXPLODE
-    game1.make_move('d8', 'c8')  # BLACK - KING MOVES
-
-    game1.make_move('a3', 'b5')  # WHITE - KNIGHT MOVES
-    game1.make_move('c8', 'b8')  # BLACK - KING MOVES
-    game1.make_move('b5', 'a7')  # WHITE - KNIGHT MOVES & CAPTURES PAWN + EXPLODE = KING DEAD
-
-    game1.print_board()
-
-    game2 = ChessVar()
-    # GAME 2
-    game2.make_move('a2', 'a3')  # WHITE
-    # print(game2.make_move('a1', 'a5'))
-    game2.make_move('a7', 'a6')  # BLACK
-    game2.make_move('h2', 'h4')  # WHITE
-    game2.make_move('d7', 'd5')  # BLACK
-
-    game2.make_move('h1', 'h3')  # WHITE
-    game2.make_move('b8', 'c6')  # BLACK
-    game2.make_move('a1', 'a2')  # WHITE
-    game2.make_move('c8', 'h3')  # BLACK
-
-    game2.make_move('g1', 'h3')  # WHITE
-
-    game2.print_board()
-
-    # game_readme_test = ChessVar()
-    # print(game_readme_test.make_move('a2', 'a4'))  # output True
-    # print(game_readme_test.make_move('g7', 'g5'))  # output True
-    # game_readme_test.print_board()
-    # print(game_readme_test.get_game_state())  # output UNFINISHED
+# MAIN
+def __getattr__(name):
+    """Loads the demo games only when ChessVar.main is asked for"""
+    if name == 'main':
+        from ChessDemo import main
+        return main
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == '__main__':
+    from ChessDemo import main
     main()
@@ -0,0 +1,255 @@
+# Author: Rafael Ayala
+# GitHub username: rayala30
+# Date: 10/19/26
+# Description: Differential testing of alternative rules backends against ChessVar on random games
+
+import argparse
+import importlib
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from ChessVar import ChessVar
+
+DEFAULT_BACKEND = 'ChessMailbox:MailboxBoard'
+
+# Random games longer than this are cut off
+MAX_PLIES = 200
+
+# Games each worker plays per task
+BATCH_SIZE = 50
+
+
+def load_backend(backend):
+    """Gets a backend class from a 'module:Class' name, or the class itself.
+
+    A backend is created without arguments and provides make_move(src, dest), get_legal_moves(),
+    get_snapshot(), get_player_turn() and get_game_state() with the same meaning as in ChessVar.
+    """
+    if not isinstance(backend, str):
+        return backend
+    module_name, _, class_name = backend.partition(':')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+# COMPARISON
+def compare(reference, candidate):
+    """Describes the first difference between the reference game and a backend, or gets None"""
+    reference_turn, reference_pieces = reference.get_snapshot()
+    candidate_turn, candidate_pieces = candidate.get_snapshot()
+    if reference_turn != candidate_turn:
+        return f"player turn {reference_turn} != {candidate_turn}"
+
+    reference_pieces, candidate_pieces = set(reference_pieces), set(candidate_pieces)
+    if reference_pieces != candidate_pieces:
+        missing = sorted(reference_pieces - candidate_pieces)
+        extra = sorted(candidate_pieces - reference_pieces)
+        return f"board differs, missing {missing}, extra {extra}"
+
+    reference_state, candidate_state = reference.get_game_state(), candidate.get_game_state()
+    if reference_state != candidate_state:
+        return f"game state {reference_state} != {candidate_state}"
+
+    reference_moves, candidate_moves = set(reference.get_legal_moves()), set(candidate.get_legal_moves())
+    if reference_moves != candidate_moves:
+        missing = sorted(reference_moves - candidate_moves)
+        extra = sorted(candidate_moves - reference_moves)
+        return f"legal moves differ, missing {missing}, extra {extra}"
+    return None
+
+
+def replay(backend, moves):
+    """Plays moves on both sides and gets (ply, difference) at the first divergence, or None.
+
+    Ply 0 is the starting position.
+    """
+    backend = load_backend(backend)
+    reference = ChessVar(verbose=False)
+    candidate = backend()
+
+    difference = compare(reference, candidate)
+    if difference:
+        return 0, difference
+
+    for ply, (src_square, dest_square) in enumerate(moves, 1):
+        reference_result = reference.make_move(src_square, dest_square)
+        candidate_result = candidate.make_move(src_square, dest_square)
+        if reference_result != candidate_result:
+            return ply, f"make_move({src_square!r}, {dest_square!r}) returned {reference_result} != {candidate_result}"
+
+        difference = compare(reference, candidate)
+        if difference:
+            return ply, difference
+    return None
+
+
+def shrink(backend, moves):
+    """Cuts a diverging game down to a short legal game that still diverges, by delta debugging"""
+    moves = _trim(backend, moves)
+    if moves is None:
+        raise ValueError("The moves do not lead to a divergence.")
+
+    # Chunks hold whole move pairs, so the moves left keep the side that plays them
+    chunks = 2
+    while len(moves) >= 2:
+        pairs = -(-len(moves) // 2)
+        size = 2 * -(-pairs // chunks)
+        for start in range(0, len(moves), size):
+            complement = _trim(backend, moves[:start] + moves[start + size:])
+            if complement is not None:
+                moves = complement
+                chunks = max(chunks - 1, 2)
+                break
+        else:
+            if chunks >= pairs:
+                break
+            chunks = min(chunks * 2, pairs)
+
+    # Needed moves of one side often sit next to removable moves of the other, so try every such pair too
+    reduced = True
+    while reduced:
+        reduced = False
+        for first in range(len(moves) - 1):
+            for second in range(first + 1, len(moves), 2):
+                complement = _trim(backend, moves[:first] + moves[first + 1:second] + moves[second + 1:])
+                if complement is not None:
+                    moves = complement
+                    reduced = True
+                    break
+            if reduced:
+                break
+    return moves
+
+
+def _trim(backend, moves):
+    """Keeps the moves that still form a legal game and cuts them at the first divergence, or gets None"""
+    # make_move accepts captures without verifying them, so legality is checked against the move list
+    reference = ChessVar(verbose=False)
+    legal_moves = []
+    for move in moves:
+        if reference.get_game_state() != 'UNFINISHED':
+            break
+        if tuple(move) in reference.get_legal_moves():
+            reference.make_move(*move)
+            legal_moves.append(tuple(move))
+
+    divergence = replay(backend, legal_moves)
+    if divergence is None:
+        return None
+    return legal_moves[:divergence[0]]
+
+
+# RANDOM GAMES
+def check_game(backend, seed, max_plies=MAX_PLIES):
+    """Plays one random game on both sides, comparing after every ply.
+
+    Gets (plies played, None) or (plies played, moves up to and including the first diverging one).
+    """
+    backend = load_backend(backend)
+    rng = random.Random(seed)
+    reference = ChessVar(verbose=False)
+    candidate = backend()
+    moves = []
+
+    if compare(reference, candidate):
+        return 0, moves
+
+    while len(moves) < max_plies and reference.get_game_state() == 'UNFINISHED':
+        move = rng.choice(reference.get_legal_moves())
+        moves.append(move)
+        reference.make_move(*move)
+        if not candidate.make_move(*move) or compare(reference, candidate):
+            return len(moves), moves
+    return len(moves), None
+
+
+def _check_batch(backend, seeds, max_plies):
+    """Plays a batch of random games in a worker process and gets (games, plies, (seed, moves) or None)"""
+    plies = 0
+    for games, seed in enumerate(seeds, 1):
+        game_plies, moves = check_game(backend, seed, max_plies)
+        plies += game_plies
+        if moves is not None:
+            return games, plies, (seed, moves)
+    return len(seeds), plies, None
+
+
+# VERIFIER CLASS
+class DifferentialVerifier:
+    """Plays random legal games across processes until a backend diverges from ChessVar"""
+
+    def __init__(self, backend=DEFAULT_BACKEND, workers=None, max_plies=MAX_PLIES, batch_size=BATCH_SIZE, seed=0):
+        self._backend = backend
+        self._workers = workers or os.cpu_count() or 1
+        self._max_plies = max_plies
+        self._batch_size = batch_size
+        self._seed = seed
+
+    def run(self, games):
+        """Plays games and yields (games played, plies played, (seed, moves) or None) as each batch finishes.
+
+        Stops after the first divergence. Game n uses random seed seed + n, so any game can be played again.
+        """
+        batches = (range(start, min(start + self._batch_size, self._seed + games))
+                   for start in range(self._seed, self._seed + games, self._batch_size))
+        played = 0
+        plies = 0
+
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            pending = set()
+            failure = None
+            while failure is None:
+                for seeds in batches:
+                    pending.add(executor.submit(_check_batch, self._backend, seeds, self._max_plies))
+                    if len(pending) >= self._workers * 2:
+                        break
+                if not pending:
+                    break
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    batch_games, batch_plies, batch_failure = future.result()
+                    played += batch_games
+                    plies += batch_plies
+                    failure = failure or batch_failure
+                yield played, plies, failure
+
+            for future in pending:
+                future.cancel()
+
+    def shrink(self, moves):
+        """Gets a minimal move list that still diverges"""
+        return shrink(self._backend, moves)
+
+
+# MAIN
+def main():
+    parser = argparse.ArgumentParser(description="Compare a rules backend with ChessVar on random games.")
+    parser.add_argument('--backend', default=DEFAULT_BACKEND, help="backend class written as module:Class")
+    parser.add_argument('--games', type=int, default=1000000, help="random games to play")
+    parser.add_argument('--workers', type=int, default=None, help="game processes (defaults to all cores)")
+    parser.add_argument('--max-plies', type=int, default=MAX_PLIES, help="longest random game")
+    parser.add_argument('--seed', type=int, default=0, help="random seed of the first game")
+    args = parser.parse_args()
+
+    verifier = DifferentialVerifier(args.backend, args.workers, args.max_plies, seed=args.seed)
+    failure = None
+    for games, plies, failure in verifier.run(args.games):
+        print(f"\r{games} games, {plies} plies", end='', flush=True)
+    print()
+
+    if failure is None:
+        print("No divergence found.")
+        return
+
+    seed, moves = failure
+    reproducer = verifier.shrink(moves)
+    ply, difference = replay(args.backend, reproducer)
+    print(f"Game with seed {seed} diverged after {len(moves)} plies.")
+    print(f"Minimal reproducer ({len(reproducer)} plies): {' '.join(src + dest for src, dest in reproducer)}")
+    print(f"After ply {ply}: {difference}")
+    raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
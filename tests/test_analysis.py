@@ -0,0 +1,41 @@
+from ChessAnalysis import analyse, root_board
+from ChessPieces import make_piece
+from ChessVar import ChessVar
+
+ROOK_SHUFFLE = (('b1', 'b2'), ('h6', 'g8'), ('b2', 'b1'), ('g8', 'h6'))
+
+
+def losing_game():
+    """Gets a game where Black, far behind, can make the third repetition with g8h6"""
+    game = ChessVar(verbose=False)
+    game.set_position({'a1': make_piece('WK'), 'a3': make_piece('WQ'), 'b1': make_piece('WR'),
+                       'h8': make_piece('BK'), 'h6': make_piece('BN')}, 'WHITE')
+    for move in ROOK_SHUFFLE + ROOK_SHUFFLE[:3]:
+        assert game.make_move(*move)
+    return game
+
+
+def test_root_move_making_the_third_repetition_is_a_draw():
+    game = losing_game()
+    results = analyse(game, depth=1, workers=1)
+    assert results[0][:3] == ('g8', 'h6', 0)
+    assert all(score < 0 for _, _, score, _, _ in results[1:])
+
+
+def test_snapshot_analysis_starts_the_draw_counters_over():
+    results = analyse(losing_game().get_snapshot(), depth=1, workers=1)
+    assert all(score < 0 for _, _, score, _, _ in results)
+
+
+def test_worker_processes_get_the_draw_counters():
+    assert analyse(losing_game(), depth=1, workers=2)[0][:3] == ('g8', 'h6', 0)
+
+
+def test_root_board_matches_the_game_after_a_capture():
+    game = ChessVar(verbose=False)
+    for move in (('e2', 'e4'), ('d7', 'd5'), ('e4', 'd5'), ('g8', 'f6'), ('g1', 'f3'), ('f6', 'g8')):
+        assert game.make_move(*move)
+    board = root_board(game)
+    assert board.get_snapshot()[0] == game.get_snapshot()[0]
+    assert sorted(board.get_snapshot()[1]) == sorted(game.get_snapshot()[1])
+    assert board._halfmove_clock == game._halfmove_clock
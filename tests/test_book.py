@@ -0,0 +1,66 @@
+from ChessBook import OpeningBook, build_book, parse_moves
+from ChessVar import ChessVar
+
+CORPUS = [
+    'e2e4 e7e5 g1f3',
+    'e2e4 e7e5 b1c3',
+    'e2e4 d7d5',
+    'd2d4 d7d5',
+]
+
+
+def test_built_book_is_probed_back(tmp_path):
+    path = str(tmp_path / 'book.abk')
+    assert build_book([parse_moves(line) for line in CORPUS], path) == 7
+
+    book = OpeningBook(path)
+    try:
+        assert len(book) == 7
+        game = ChessVar(verbose=False)
+        game.make_move('e2', 'e4')
+        game.make_move('e7', 'e5')
+        assert sorted(book.probe(game)) == [('b1', 'c3', 1), ('g1', 'f3', 1)]
+    finally:
+        book.close()
+
+
+def test_moves_of_one_position_are_ordered_by_weight(tmp_path):
+    path = str(tmp_path / 'book.abk')
+    build_book([parse_moves(line) for line in CORPUS], path)
+
+    book = OpeningBook(path)
+    try:
+        assert book.probe(ChessVar(verbose=False)) == [('e2', 'e4', 3), ('d2', 'd4', 1)]
+        game = ChessVar(verbose=False)
+        game.make_move('e2', 'e4')
+        assert book.probe(game) == [('e7', 'e5', 2), ('d7', 'd5', 1)]
+    finally:
+        book.close()
+
+
+def test_empty_book_has_no_moves(tmp_path):
+    path = str(tmp_path / 'book.abk')
+    assert build_book([], path) == 0
+
+    book = OpeningBook(path)
+    try:
+        assert len(book) == 0
+        assert book.probe(ChessVar(verbose=False)) == []
+    finally:
+        book.close()
+
+
+def test_position_missing_from_book_has_no_moves(tmp_path):
+    path = str(tmp_path / 'book.abk')
+    build_book([parse_moves(line) for line in CORPUS], path)
+
+    book = OpeningBook(path)
+    try:
+        game = ChessVar(verbose=False)
+        game.make_move('h2', 'h3')
+        assert book.probe(game) == []
+        # Hashes past either end of the sorted records
+        assert book.probe_hash(0) == []
+        assert book.probe_hash(2 ** 64 - 1) == []
+    finally:
+        book.close()
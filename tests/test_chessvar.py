@@ -0,0 +1,8 @@
+from ChessVar import ChessVar
+
+
+def test_silent_game_prints_nothing_for_rejected_moves(capsys):
+    game = ChessVar(verbose=False)
+    assert not game.make_move('a1', 'a5')
+    assert not game.make_move('b1', 'b3')
+    assert capsys.readouterr().out == ''
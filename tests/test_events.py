@@ -0,0 +1,82 @@
+import logging
+import random
+
+from ChessEvents import BoardDiff
+from ChessPieces import make_piece
+from ChessVar import ChessVar
+
+KNIGHT_SHUFFLE = (('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8'))
+
+
+def codes(game):
+    """Gets the board of a game as piece codes"""
+    return {square: str(piece) for square, piece in game.get_board().items()}
+
+
+def check_diffs(game, moves):
+    """Plays moves and checks that each diff turns the previous board into the next one"""
+    diffs = []
+    game.subscribe(diffs.append)
+    for move in moves:
+        board = codes(game)
+        assert game.make_move(*move)
+        diff = diffs[-1]
+
+        for square in diff.get_vacated():
+            board.pop(square, None)
+        board.update(diff.get_filled())
+        assert board == codes(game)
+        assert diff.get_player_turn() == game.get_player_turn()
+        assert diff.get_result() == game.get_game_state()
+        assert BoardDiff.from_bytes(diff.to_bytes()) == diff
+    return diffs
+
+
+def test_diffs_rebuild_random_games():
+    rng = random.Random(5)
+    captures = 0
+    for _ in range(60):
+        game = ChessVar(verbose=False)
+        moves = []
+        scratch = ChessVar(verbose=False)
+        while scratch.get_game_state() == 'UNFINISHED' and len(moves) < 120:
+            move = rng.choice(scratch.get_legal_moves())
+            scratch.make_move(*move)
+            moves.append(move)
+        diffs = check_diffs(game, moves)
+        captures += sum(1 for diff in diffs if diff.get_exploded())
+    # Enough of the moves were captures with an explosion
+    assert captures > 20
+
+
+def test_diff_of_a_king_capture_skips_the_explosion():
+    game = ChessVar(verbose=False)
+    game.set_position({'e1': make_piece('WK'), 'd4': make_piece('WR'), 'd8': make_piece('BK'),
+                       'c8': make_piece('BN'), 'e8': make_piece('BQ')}, 'WHITE')
+    diff, = check_diffs(game, [('d4', 'd8')])
+    assert diff.get_exploded() == ()
+    assert diff.get_result() == 'WHITE_WON'
+    # The neighbours of the captured King stay on the board
+    assert set(codes(game)) == {'e1', 'c8', 'e8'}
+
+
+def test_diff_of_a_drawing_move():
+    game = ChessVar(verbose=False)
+    diffs = check_diffs(game, KNIGHT_SHUFFLE * 2)
+    assert diffs[-1].get_result() == 'DRAW'
+
+
+def test_failing_subscriber_does_not_undo_the_move(caplog):
+    game = ChessVar(verbose=False)
+    received = []
+
+    def fail(diff):
+        raise RuntimeError("spectator went away")
+
+    game.subscribe(fail)
+    game.subscribe(received.append)
+    with caplog.at_level(logging.ERROR):
+        assert game.make_move('e2', 'e4')
+    assert game.get_player_turn() == 'BLACK'
+    assert len(received) == 1
+    assert 'spectator went away' in caplog.text
@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+from ChessGameManager import GameManager
+
+
+class InterruptedLock:
+    """Lock that runs a callback the first time someone is about to wait for it"""
+
+    def __init__(self, on_wait):
+        self._lock = threading.Lock()
+        self._on_wait = on_wait
+
+    def __enter__(self):
+        on_wait, self._on_wait = self._on_wait, None
+        if on_wait is not None:
+            on_wait()
+        self._lock.acquire()
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+def test_move_waiting_on_a_removed_game_fails():
+    manager = GameManager()
+    manager.create_game('game')
+    manager._locks['game'] = InterruptedLock(lambda: manager.remove_game('game'))
+
+    with pytest.raises(ValueError):
+        manager.make_move('game', 'a2', 'a3')
+
+
+def test_move_waiting_on_a_replaced_game_leaves_the_new_game_alone():
+    manager = GameManager()
+    manager.create_game('game')
+
+    def replace():
+        manager.remove_game('game')
+        manager.create_game('game')
+
+    manager._locks['game'] = InterruptedLock(replace)
+    with pytest.raises(ValueError):
+        manager.make_move('game', 'a2', 'a3')
+    assert manager.get_player_turn('game') == 'WHITE'
+    assert manager.make_move('game', 'a2', 'a3')
+
+
+def test_moves_on_different_games_run_in_parallel():
+    manager = GameManager()
+    first, second = manager.create_game(), manager.create_game()
+
+    with manager.locked_game(first):
+        # A held game does not block moves on another one
+        thread = threading.Thread(target=manager.make_move, args=(second, 'a2', 'a3'))
+        thread.start()
+        thread.join(5)
+        assert not thread.is_alive()
+    assert manager.get_player_turn(second) == 'BLACK'
@@ -0,0 +1,80 @@
+import random
+
+import pytest
+
+from ChessGamePool import GamePool
+from ChessPieces import make_piece
+from ChessVar import ChessVar
+
+
+def state(game):
+    """Gets everything a fresh game and a recycled one must agree on"""
+    return (game.get_snapshot(), game.get_position_hash(), game.get_game_state(), game.get_draw_reason(),
+            game.get_ply(), [repr(record) for record in game.get_history()], game._history._checkpoints,
+            game._hash_history, game._halfmove_clock, game._repetitions, game._subscribers)
+
+
+def play_random(game, plies, seed):
+    """Plays random legal moves while the game is unfinished"""
+    rng = random.Random(seed)
+    for _ in range(plies):
+        if game.get_game_state() != 'UNFINISHED':
+            break
+        game.make_move(*rng.choice(game.get_legal_moves()))
+
+
+def used_games():
+    """Gets games left in different states: after captures, after a seek back and after set_position"""
+    captured = ChessVar(verbose=False)
+    play_random(captured, 60, seed=1)
+    assert any(record.get_captured() for record in captured.get_history())
+
+    sought = ChessVar(verbose=False)
+    play_random(sought, 40, seed=2)
+    sought.seek(7)
+    sought.subscribe(lambda diff: None)
+
+    positioned = ChessVar(verbose=False)
+    positioned.set_position({'e1': make_piece('WK'), 'e8': make_piece('BK'), 'a7': make_piece('WP', True)}, 'BLACK')
+    return [captured, sought, positioned]
+
+
+@pytest.mark.parametrize('index', range(3))
+def test_recycled_game_equals_a_fresh_one(index):
+    game = used_games()[index]
+    game.reset()
+    fresh = ChessVar(verbose=False)
+    assert state(game) == state(fresh)
+
+    # Both go on to play the same game the same way
+    play_random(game, 80, seed=9)
+    play_random(fresh, 80, seed=9)
+    assert state(game) == state(fresh)
+
+
+def test_reset_reuses_the_same_pieces():
+    game = ChessVar(verbose=False)
+    board = game.get_board()
+    pieces = {id(piece) for piece in board.values()}
+
+    play_random(game, 60, seed=1)
+    game.seek(5)
+    game.set_position({'e1': make_piece('WK'), 'e8': make_piece('BK')}, 'WHITE')
+    game.reset()
+    assert game.get_board() is board
+    assert {id(piece) for piece in game.get_board().values()} == pieces
+    # Pawns moved in the previous game stand unmoved again
+    assert not any(has_moved for _, _, has_moved in game.get_snapshot()[1])
+
+
+def test_game_released_twice_is_refused():
+    pool = GamePool()
+    game = pool.acquire()
+    assert pool.release(game)
+    with pytest.raises(ValueError):
+        pool.release(game)
+    assert len(pool) == 1
+
+    # Handed out again, it can be released again
+    assert pool.acquire() is game
+    assert pool.release(game)
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from ChessHistory import CHECKPOINT_INTERVAL
+from ChessVar import ChessVar
+
+PAWN_MOVES = (('a2', 'a3'), ('a7', 'a6'), ('b2', 'b3'), ('b7', 'b6'), ('c2', 'c3'),
+              ('c7', 'c6'), ('d2', 'd3'), ('d7', 'd6'), ('h2', 'h3'), ('h7', 'h6'))
+KNIGHT_SHUFFLE = (('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8'))
+
+
+def state(game):
+    """Gets the position, hash, game state and draw reason of a game"""
+    return game.get_snapshot(), game.get_position_hash(), game.get_game_state(), game.get_draw_reason()
+
+
+def play(game, moves):
+    """Plays moves and gets the state of the game before the first one and after each one"""
+    states = [state(game)]
+    for move in moves:
+        assert game.make_move(*move)
+        states.append(state(game))
+    return states
+
+
+def random_moves(plies, seed):
+    """Gets random legal moves of a game that lasts the given number of plies"""
+    rng = random.Random(seed)
+    while True:
+        game = ChessVar(verbose=False)
+        moves = []
+        while len(moves) < plies and game.get_game_state() == 'UNFINISHED':
+            move = rng.choice(game.get_legal_moves())
+            game.make_move(*move)
+            moves.append(move)
+        if len(moves) == plies:
+            return moves
+
+
+def random_moves_from(game, plies, seed):
+    """Gets random legal moves from the current position of a game, without playing them on it"""
+    rng = random.Random(seed)
+    scratch = ChessVar(verbose=False)
+    scratch.restore_snapshot(game.get_snapshot())
+    moves = []
+    for _ in range(plies):
+        move = rng.choice(scratch.get_legal_moves())
+        scratch.make_move(*move)
+        moves.append(move)
+    return moves
+
+
+def test_seek_matches_the_live_game_on_both_sides_of_a_checkpoint():
+    game = ChessVar(verbose=False)
+    # The third repetition comes two plies after the first checkpoint
+    states = play(game, PAWN_MOVES + KNIGHT_SHUFFLE * 2)
+    assert len(states) - 1 == CHECKPOINT_INTERVAL + 2
+    assert states[-1][2:] == ('DRAW', 'THREEFOLD_REPETITION')
+
+    for ply in reversed(range(len(states))):
+        game.seek(ply)
+        assert game.get_ply() == ply
+        assert state(game) == states[ply]
+    # Forward again from the start
+    for ply in range(len(states)):
+        game.seek(ply)
+        assert state(game) == states[ply]
+
+
+def test_seek_matches_the_live_game_over_several_checkpoints():
+    game = ChessVar(verbose=False)
+    states = play(game, random_moves(3 * CHECKPOINT_INTERVAL + 5, seed=7))
+
+    for ply in (0, 1, 15, 16, 17, 31, 32, 33, len(states) - 1, 20, 5):
+        game.seek(ply)
+        assert state(game) == states[ply]
+
+
+def test_move_after_seeking_back_truncates_records_and_checkpoints():
+    moves = random_moves(2 * CHECKPOINT_INTERVAL + 4, seed=11)
+    game = ChessVar(verbose=False)
+    states = play(game, moves)
+    assert len(game._history._checkpoints) == 3
+
+    game.seek(20)
+    move = game.get_legal_moves()[0]
+    assert game.make_move(*move)
+    assert len(game.get_history()) == 21
+    assert [(record.get_source(), record.get_destination()) for record in game.get_history()] == moves[:20] + [move]
+    # The checkpoint at ply 32 belonged to the replaced moves
+    assert len(game._history._checkpoints) == 2
+    with pytest.raises(ValueError):
+        game.seek(22)
+
+    # New moves past the old checkpoint take fresh checkpoints that seek can use
+    replaced = play(game, random_moves_from(game, 2 * CHECKPOINT_INTERVAL - 20, seed=3))
+    for ply in (32, 21, 20, 0):
+        game.seek(ply)
+        expected = replaced[ply - 21] if ply >= 21 else states[ply]
+        assert state(game) == expected
+
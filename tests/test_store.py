@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+
+from ChessStore import GameStore
+
+KNIGHT_SHUFFLE = (('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8'))
+
+
+def test_reloaded_game_keeps_draw_counters(tmp_path):
+    path = str(tmp_path / 'games.db')
+    with GameStore(path, snapshot_interval=4) as store:
+        game = store.create_game('draw')
+        for move in (('e2', 'e4'), ('e7', 'e5')) + KNIGHT_SHUFFLE + KNIGHT_SHUFFLE[:3]:
+            assert game.make_move(*move)
+        live = game.get_snapshot()
+
+    with GameStore(path, snapshot_interval=4) as store:
+        game = store.get_game('draw')
+        assert game.get_snapshot() == live
+        assert game.make_move(*KNIGHT_SHUFFLE[3])
+        assert game.get_game_state() == 'DRAW'
+        assert game.get_draw_reason() == 'THREEFOLD_REPETITION'
+
+
+def test_moves_replaced_after_seek_are_stored_in_order(tmp_path):
+    path = str(tmp_path / 'games.db')
+    with GameStore(path, flush_interval=60) as store:
+        game = store.create_game('seek')
+        for move in (('e2', 'e4'), ('e7', 'e5'), ('d2', 'd4')):
+            assert game.make_move(*move)
+        store.flush()
+        game.seek(2)
+        assert game.make_move('a2', 'a3')
+        live = game.get_snapshot()
+
+    with GameStore(path) as store:
+        assert store.get_game('seek').get_snapshot() == live
+
+
+def test_writer_survives_a_failed_batch(tmp_path):
+    path = str(tmp_path / 'games.db')
+    with GameStore(path, flush_interval=0.01) as store:
+        store._queue("INSERT INTO missing_table VALUES (?)", (1,))
+        # Let the writer thread pick up the bad batch
+        deadline = time.monotonic() + 5
+        while store._pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        game = store.create_game('after')
+        assert game.make_move('e2', 'e4')
+
+    with GameStore(path) as store:
+        assert store.get_game('after').get_ply() == 1
+
+
+def test_concurrent_loads_give_one_game(tmp_path):
+    path = str(tmp_path / 'games.db')
+    with GameStore(path) as store:
+        store.create_game('shared').make_move('e2', 'e4')
+
+    with GameStore(path) as store:
+        load = store._load
+
+        def slow_load(game_id):
+            # Leaves time for the other thread to ask for the same game
+            time.sleep(0.05)
+            load(game_id)
+
+        store._load = slow_load
+        games = []
+        threads = [threading.Thread(target=lambda: games.append(store.get_game('shared'))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(games) == 4 and all(game is games[0] for game in games)
+
+        # Moves made on the game every caller got are stored
+        assert games[0].make_move('e7', 'e5')
+
+    with GameStore(path) as store:
+        assert store.get_game('shared').get_ply() == 2
+
+
+def test_create_game_does_not_flush(tmp_path):
+    path = str(tmp_path / 'games.db')
+    with GameStore(path) as store:
+        store.create_game('old')
+
+    with GameStore(path, flush_interval=60) as store:
+        store.create_game('first')
+        store.create_game('second')
+        # Both games are still waiting for the writer
+        assert sum(statement.startswith("INSERT OR IGNORE INTO games") for statement, _ in store._pending) == 2
+        for game_id in ('old', 'first'):
+            with pytest.raises(ValueError):
+                store.create_game(game_id)
+        assert store.get_game_ids() == ['old', 'first', 'second']
@@ -0,0 +1,67 @@
+import os
+from array import array
+
+import pytest
+
+from ChessPieces import King, Knight
+from ChessTablebase import (SQUARES, TRANSFORMS, _retrograde, board_index, check_tablebase, generate_tablebase,
+                            index_board, table_groups, table_size)
+
+# A four piece table takes several minutes to generate in pure Python
+slow = pytest.mark.skipif(not os.environ.get('ATOMIC_CHESS_SLOW_TESTS'),
+                          reason="set ATOMIC_CHESS_SLOW_TESTS=1 to generate full tables")
+
+
+def test_capture_can_be_the_slowest_loss():
+    # Position 0 has a quiet move into position 1, where the opponent wins at once, and a capture losing in 5.
+    # Only five piece tables hold such captures, so the positions are made up here
+    valid = bytearray([1, 1])
+    quiet_counts = bytearray([1, 0])
+    capture_values = array('b', [-5, 1])
+    predecessors = {0: [], 1: [0]}
+
+    values = _retrograde('test', valid, quiet_counts, capture_values,
+                         lambda indexes: [predecessors[index] for index in indexes])
+    assert list(values) == [-5, 1]
+
+
+def test_quiet_move_can_be_the_slowest_loss():
+    # Position 0 has a quiet move into position 1, where the opponent wins in 3, and a capture losing at once
+    valid = bytearray([1, 1])
+    quiet_counts = bytearray([1, 0])
+    capture_values = array('b', [-1, 3])
+    predecessors = {0: [], 1: [0]}
+
+    values = _retrograde('test', valid, quiet_counts, capture_values,
+                         lambda indexes: [predecessors[index] for index in indexes])
+    assert list(values) == [-4, 3]
+
+
+def test_symmetric_boards_share_one_index():
+    groups = table_groups('KNNvK')
+    board = {'b1': King('WHITE'), 'g7': King('BLACK'), 'c3': Knight('WHITE'), 'e5': Knight('WHITE')}
+    index = board_index(board, 'BLACK', groups)
+
+    for transform in TRANSFORMS:
+        image = {SQUARES[transform[SQUARES.index(square)]]: piece for square, piece in board.items()}
+        assert board_index(image, 'BLACK', groups) == index
+    decoded, player_turn = index_board(index, groups)
+    assert player_turn == 'BLACK'
+    assert board_index(decoded, 'BLACK', groups) == index
+
+
+def test_identical_pieces_share_one_digit():
+    # 518 King placements times 2016 sets of two Knight squares, for each player to move
+    assert table_size(table_groups('KNNvK')) == 2 * 518 * 2016
+
+
+def test_five_pieces_are_refused(tmp_path):
+    with pytest.raises(ValueError):
+        generate_tablebase('KQRvKN', str(tmp_path))
+
+
+@slow
+def test_table_is_consistent(tmp_path):
+    # In four piece tables every capture ends the game or leaves bare Kings, the check covers the quiet moves
+    generate_tablebase('KRvKN', str(tmp_path))
+    assert check_tablebase('KRvKN', str(tmp_path), step=97) == []
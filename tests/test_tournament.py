@@ -0,0 +1,19 @@
+from ChessTournament import SPRT
+
+
+def test_engine_that_never_loses_is_accepted():
+    sprt = SPRT()
+    for _ in range(500):
+        sprt.add(1)
+    for _ in range(10):
+        sprt.add(0.5)
+    assert sprt.llr() > 0
+    assert sprt.get_status() == 'H1'
+
+
+def test_identical_results_give_no_evidence():
+    sprt = SPRT()
+    for _ in range(20):
+        sprt.add(0.5)
+    assert sprt.llr() == 0.0
+    assert sprt.get_status() == 'CONTINUE'
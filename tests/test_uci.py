@@ -0,0 +1,38 @@
+import io
+
+from ChessUCI import UCIEngine
+
+
+def run_go(engine, command):
+    """Sends 'go' without any 'stop' and gets the lines the engine wrote once its search ended by itself"""
+    engine.handle('position startpos moves e2e4')
+    engine.handle(command)
+    engine._search_thread.join(60)
+    assert not engine._search_thread.is_alive()
+    return engine._output.getvalue().splitlines()
+
+
+def test_go_depth_ends_by_itself():
+    engine = UCIEngine(output_stream=io.StringIO(), workers=1)
+    lines = run_go(engine, 'go depth 1')
+    assert lines[-1].startswith('bestmove ') and lines[-1] != 'bestmove 0000'
+
+
+def test_bare_go_ends_by_itself():
+    engine = UCIEngine(output_stream=io.StringIO(), workers=1)
+    lines = run_go(engine, 'go')
+    assert lines[-1].startswith('bestmove ') and lines[-1] != 'bestmove 0000'
+
+
+def test_failed_search_still_sends_bestmove():
+    engine = UCIEngine(output_stream=io.StringIO(), workers=1)
+    engine.handle('go nodes 10')
+    engine._search_thread.join(60)
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("rollout process died")
+
+    engine._player.search = fail
+    lines = run_go(engine, 'go nodes 10')
+    assert lines[-2].startswith('info string search failed')
+    assert lines[-1] == 'bestmove 0000'
@@ -0,0 +1,14 @@
+from ChessValidation import MoveValidator
+from ChessVar import ChessVar
+
+
+def test_drawn_game_does_not_poison_the_cache():
+    validator = MoveValidator()
+    game = ChessVar(verbose=False)
+    for _ in range(2):
+        for move in (('g1', 'f3'), ('g8', 'f6'), ('f3', 'g1'), ('f6', 'g8')):
+            assert game.make_move(*move)
+    assert game.get_game_state() == 'DRAW'
+
+    validator.get_destinations(game, 'b1')
+    assert validator.get_destinations(ChessVar(verbose=False), 'b1') == ['a3', 'c3']
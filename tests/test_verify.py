@@ -0,0 +1,31 @@
+from ChessMailbox import MailboxBoard
+from ChessVar import ChessVar
+from ChessVerify import DifferentialVerifier, check_game, replay, shrink
+
+
+class NoExplosionBoard(MailboxBoard):
+    """Backend with an injected bug: captures never blow up the neighbours"""
+
+    def _capture(self, src, dest):
+        self._squares[src] = self._squares[dest] = None
+        self._pawn_moved[src] = self._pawn_moved[dest] = False
+
+
+def test_runs_every_game_from_any_seed():
+    verifier = DifferentialVerifier(workers=1, max_plies=10, batch_size=2, seed=1000)
+    results = list(verifier.run(3))
+    assert results[-1][0] == 3
+    assert results[-1][2] is None
+
+
+def test_shrunk_reproducer_is_a_legal_game():
+    for seed in range(3):
+        _, moves = check_game(NoExplosionBoard, seed)
+        reproducer = shrink(NoExplosionBoard, moves)
+        assert replay(NoExplosionBoard, reproducer) is not None
+        assert len(reproducer) <= len(moves)
+
+        game = ChessVar(verbose=False)
+        for move in reproducer:
+            assert move in game.get_legal_moves()
+            game.make_move(*move)